@@ -4,27 +4,63 @@ MySQL Database Connection Manager for Python
 =============================================
 Purpose: Enterprise-grade MySQL connection management for Python applications
 Based on: mysql-instructions.md connection guidelines
-Features: Connection pooling, error handling, query optimization, monitoring
+Features: Connection pooling, error handling, query optimization, monitoring,
+          optional asyncio support (AsyncDatabaseManager, requires asyncmy or aiomysql)
 """
 
 import os
+import re
+import hashlib
 import logging
 import time
 import threading
-from contextlib import contextmanager
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
-import mysql.connector
-from mysql.connector import pooling, Error
-import yaml
+import weakref
+import itertools
+import functools
+import concurrent.futures
+import tempfile
+import queue
+from contextlib import contextmanager, asynccontextmanager
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Mapping, Final
+from datetime import datetime
 import json
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from dataclasses import dataclass, replace
+from types import SimpleNamespace, MappingProxyType
+from collections import deque, namedtuple, OrderedDict
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# mysql.connector is imported on first use (see _load_driver) so processes that
+# only need DatabaseConfig don't pay for it; these names are rebound at that point
+mysql = None
+ClientFlag = None
+
+
+class Error(Exception):
+    """Placeholder for mysql.connector.Error until the driver is loaded"""
+
+
+class PoolError(Error):
+    """Placeholder for mysql.connector.errors.PoolError until the driver is loaded"""
+
+
+def _load_driver() -> None:
+    """Import mysql.connector and bind it to the module-level names"""
+    global mysql, Error, PoolError, ClientFlag
+    if mysql is not None:
+        return
+    
+    import mysql.connector
+    from mysql.connector import Error
+    from mysql.connector.errors import PoolError
+    from mysql.connector.constants import ClientFlag
+    
+    # The C extension decodes rows several times faster than the pure-Python protocol
+    if not getattr(mysql.connector, 'HAVE_CEXT', False):
+        logger.warning("mysql-connector C extension not available; falling back to the pure-Python driver")
+
 
 @dataclass
 class DatabaseConfig:
@@ -38,7 +74,12 @@ class DatabaseConfig:
     # Pool settings
     pool_name: str = 'mysql_pool'
     pool_size: int = 10
-    pool_reset_session: bool = True
+    max_parallel: Optional[int] = None  # Worker threads for execute_parallel (defaults to pool_size)
+    # Session reset wipes the audit variables on every return to the pool;
+    # they are set once per physical connection instead (see get_connection)
+    pool_reset_session: bool = False
+    pool_wait_timeout: float = 5.0  # Seconds to wait for a free connection when exhausted
+    pool_idle_check: float = 30.0  # Ping connections idle longer than this before reuse
     
     # Connection settings
     autocommit: bool = False
@@ -54,7 +95,39 @@ class DatabaseConfig:
     
     # Timeout settings
     connection_timeout: int = 60
-    auth_plugin: str = 'mysql_native_password'
+    auth_plugin: str = 'caching_sha2_password'  # MySQL 8 default; fast auth after the first login
+    
+    # Driver settings
+    use_pure: bool = False  # Use the C extension when installed
+    compress: bool = False  # zlib protocol compression (enabled for remote servers)
+    
+    # Server-side prepared statements, cached per physical connection
+    prepared_statements: bool = True
+    prepared_cache_size: int = 64
+    
+    # Adaptive batch_insert sizing: batches grow or shrink toward this latency
+    batch_target_latency_ms: float = 100.0
+    
+    # health_check reuses a healthy result for this many seconds
+    health_check_ttl: float = 5.0
+    
+    # Prefix SELECTs with SQL_CACHE (MariaDB / MySQL < 8.0 with the query cache on)
+    query_cache_hint: bool = False
+    
+    # LOAD DATA LOCAL INFILE bulk path for very large batch_insert calls
+    allow_local_infile: bool = False
+    bulk_load_threshold: int = 50000  # rows
+    
+    # Buffered audit writes (log_audit): flush interval and size trigger
+    audit_flush_interval: float = 0.1  # seconds
+    audit_flush_rows: int = 2000
+    
+    # Rows fetched per round of execute_query_stream (memory bound vs. call overhead)
+    stream_fetch_size: int = 1000
+    
+    # Query result cache settings
+    query_cache_size: int = 1024
+    query_cache_ttl: float = 60.0  # seconds
     
     # Application context
     application_name: str = 'Python-App'
@@ -63,7 +136,23 @@ class DatabaseConfig:
     
     @classmethod
     def from_environment(cls, environment: str = 'development') -> 'DatabaseConfig':
-        """Create configuration from environment variables"""
+        """
+        Create configuration from environment variables
+        
+        The environment is parsed once per (class, environment); each call
+        returns a fresh copy so callers may modify it. Call
+        reload_environment() after changing DB_* variables.
+        """
+        return replace(_environment_config(cls, environment))
+    
+    @classmethod
+    def reload_environment(cls) -> None:
+        """Forget parsed environments so the next from_environment() re-reads DB_* variables"""
+        _environment_config.cache_clear()
+    
+    @classmethod
+    def _parse_environment(cls, environment: str) -> 'DatabaseConfig':
+        """Read DB_* environment variables into a new configuration"""
         config = cls()
         
         # Load from environment variables
@@ -77,16 +166,22 @@ class DatabaseConfig:
         # Environment-specific settings
         if environment == 'production':
             config.pool_size = 20
+            config.compress = True
             config.ssl_disabled = False
             config.ssl_ca = os.getenv('DB_SSL_CA')
             config.ssl_cert = os.getenv('DB_SSL_CERT')
             config.ssl_key = os.getenv('DB_SSL_KEY')
         elif environment == 'staging':
             config.pool_size = 15
+            config.compress = True
             config.ssl_disabled = os.getenv('DB_SSL', 'false').lower() != 'true'
         else:  # development
             config.pool_size = 5
             config.password = config.password or 'SecureAppPassword123!'
+        
+        # Explicit pool size override for deployments that see pool exhaustion
+        if os.getenv('DB_POOL_SIZE'):
+            config.pool_size = int(os.getenv('DB_POOL_SIZE'))
             
         return config
     
@@ -95,11 +190,71 @@ class DatabaseConfig:
         """Load configuration from YAML file"""
         try:
             with open(config_file, 'r') as file:
-                data = yaml.safe_load(file)
-                return cls(**data)
+                return cls(**_load_yaml(file))
         except FileNotFoundError:
-            logger.warning(f"Config file {config_file} not found, using defaults")
+            logger.warning("Config file %s not found, using defaults", config_file)
             return cls()
+    
+    @classmethod
+    def from_json(cls, config_file: str) -> 'DatabaseConfig':
+        """Load configuration from JSON file (e.g. precompiled with convert_yaml_to_json)"""
+        try:
+            with open(config_file, 'r') as file:
+                return cls(**json.load(file))
+        except FileNotFoundError:
+            logger.warning("Config file %s not found, using defaults", config_file)
+            return cls()
+
+
+@functools.lru_cache(maxsize=8)
+def _environment_config(cls: type, environment: str) -> DatabaseConfig:
+    """Memoized DatabaseConfig.from_environment template (never handed out directly)"""
+    return cls._parse_environment(environment)
+
+
+def _load_yaml(stream) -> Dict[str, Any]:
+    """Parse YAML with the libyaml C loader when available"""
+    import yaml  # Imported lazily: only YAML-configured processes pay for it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+def convert_yaml_to_json(src: str, dst: str) -> None:
+    """
+    Precompile a YAML config file to JSON for faster startup
+    
+    Args:
+        src: Source YAML file path
+        dst: Destination JSON file path
+    """
+    with open(src, 'r') as file:
+        data = _load_yaml(file)
+    with open(dst, 'w') as file:
+        json.dump(data, file, indent=2)
+
+
+class _Counter:
+    """
+    Running total updated from many threads without a lock
+    
+    Each thread adds into its own slot, keyed by thread id, so no two
+    threads ever read-modify-write the same value; reads copy the slots
+    (atomic under the GIL) and sum them
+    """
+    __slots__ = ('_initial', '_counts')
+    
+    def __init__(self, initial=0):
+        self._initial = initial
+        self._counts = {}
+    
+    def increment(self, amount=1) -> None:
+        counts = self._counts
+        ident = threading.get_ident()
+        counts[ident] = counts.get(ident, 0) + amount
+    
+    @property
+    def value(self):
+        return sum(self._counts.copy().values(), self._initial)
 
 
 class QueryMetrics:
@@ -111,32 +266,33 @@ class QueryMetrics:
         self.errors = 0
         self.total_execution_time = 0
         self.slow_query_threshold = 1.0  # 1 second
-        self.query_history = []
+        self.query_history = deque(maxlen=100)  # Keep last 100 queries for analysis
         self.lock = threading.Lock()
+        self._start_ns = time.monotonic_ns()  # Uptime clock, immune to wall-clock jumps
     
     def record_query(self, sql: str, execution_time: float, success: bool = True):
         """Record query execution metrics"""
+        is_slow = execution_time > self.slow_query_threshold
+        
+        # Only the scalar read-modify-write updates need the lock
         with self.lock:
             self.total_queries += 1
             self.total_execution_time += execution_time
-            
             if not success:
                 self.errors += 1
-            
-            if execution_time > self.slow_query_threshold:
+            if is_slow:
                 self.slow_queries += 1
-                logger.warning(f"Slow query detected ({execution_time:.3f}s): {sql[:100]}...")
-            
-            # Keep last 100 queries for analysis
-            self.query_history.append({
-                'sql': sql[:200],  # Truncate for memory
-                'execution_time': execution_time,
-                'success': success,
-                'timestamp': datetime.now()
-            })
-            
-            if len(self.query_history) > 100:
-                self.query_history.pop(0)
+        
+        if is_slow:
+            logger.warning("Slow query detected (%.3fs): %s...", execution_time, sql[:100])
+        
+        # deque.append is atomic; the bounded deque drops the oldest entry once full
+        self.query_history.append({
+            'sql': sql[:200],  # Truncate for memory
+            'execution_time': execution_time,
+            'success': success,
+            'timestamp': time.time()  # Epoch seconds, formatted on read
+        })
     
     @property
     def average_execution_time(self) -> float:
@@ -154,7 +310,7 @@ class QueryMetrics:
         return (self.slow_queries / self.total_queries * 100) if self.total_queries > 0 else 0
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get comprehensive statistics"""
+        """Get comprehensive statistics (read without locking; may be slightly stale)"""
         return {
             'total_queries': self.total_queries,
             'slow_queries': self.slow_queries,
@@ -162,10 +318,312 @@ class QueryMetrics:
             'average_execution_time': self.average_execution_time,
             'error_rate': self.error_rate,
             'slow_query_rate': self.slow_query_rate,
-            'slow_query_threshold': self.slow_query_threshold
+            'slow_query_threshold': self.slow_query_threshold,
+            'uptime_seconds': (time.monotonic_ns() - self._start_ns) / 1e9
         }
 
 
+class QueryCache:
+    """Bounded TTL/LRU cache of SELECT results keyed by (sql, params)"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expires_at, sql, value)
+        self.lock = threading.RLock()
+    
+    @staticmethod
+    def make_key(sql: str, params: Optional[Tuple]) -> bytes:
+        """Build a compact cache key from the SQL text and its parameters"""
+        return hashlib.blake2b(sql.encode() + repr(params).encode(), digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired"""
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+    
+    def put(self, key: bytes, sql: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self.lock:
+            self._entries[key] = (time.monotonic() + self.ttl, sql, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, table: Optional[str] = None) -> int:
+        """
+        Drop cached entries whose SQL reads from the given table
+        
+        Args:
+            table: Table name; None clears the whole cache
+            
+        Returns:
+            Number of entries removed
+        """
+        with self.lock:
+            if table is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            
+            pattern = re.compile(rf"\b(?:FROM|JOIN)\s+`?{re.escape(table)}`?(?:\s|$|,|\))", re.IGNORECASE)
+            stale = [key for key, (_, sql, _) in self._entries.items() if pattern.search(sql)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+
+# Matches the target table of INSERT/UPDATE/DELETE/REPLACE statements
+_WRITE_TABLE_RE = re.compile(
+    r"^\s*(?:INSERT(?:\s+IGNORE)?\s+INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)`?",
+    re.IGNORECASE
+)
+
+
+class _LastInsertId:
+    """Parameter sentinel for the id generated by the previous INSERT"""
+    
+    def __repr__(self) -> str:
+        return 'LAST_INSERT_ID'
+
+
+# Use as a parameter value in execute_transaction to reference the id generated
+# by the preceding INSERT; it is spliced into the SQL as LAST_INSERT_ID()
+LAST_INSERT_ID = _LastInsertId()
+
+
+def _splice_last_insert_id(sql: str, params: Optional[Tuple]) -> Tuple[str, Tuple]:
+    """Replace %s placeholders bound to LAST_INSERT_ID with the SQL function call"""
+    params = params or ()
+    if not any(value is LAST_INSERT_ID for value in params):
+        return sql, params
+    
+    parts = sql.split('%s')
+    if len(parts) != len(params) + 1:
+        raise ValueError(f"LAST_INSERT_ID needs one %s per parameter: {sql}")
+    
+    pieces = [parts[0]]
+    kept = []
+    for value, part in zip(params, parts[1:]):
+        if value is LAST_INSERT_ID:
+            pieces.append('LAST_INSERT_ID()')
+        else:
+            pieces.append('%s')
+            kept.append(value)
+        pieces.append(part)
+    return ''.join(pieces), tuple(kept)
+
+
+# MySQL accepts at most this many placeholders in one prepared statement
+_MAX_PLACEHOLDERS = 65535
+
+
+@functools.lru_cache(maxsize=256)
+def _insert_sql(table: str, columns: Tuple[str, ...], on_duplicate_update: bool) -> Tuple[str, str, str]:
+    """
+    Build the fixed parts of a multi-row INSERT once per statement shape
+    
+    Returns:
+        Tuple of (statement prefix, per-row placeholder group, ON DUPLICATE KEY suffix)
+    """
+    row_placeholder = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    base_sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    
+    update_sql = ''
+    if on_duplicate_update:
+        update_clause = ', '.join([f"{col} = VALUES({col})" for col in columns])
+        update_sql = f" ON DUPLICATE KEY UPDATE {update_clause}"
+    
+    return base_sql, row_placeholder, update_sql
+
+
+@functools.lru_cache(maxsize=64)
+def _insert_statement(table: str, columns: Tuple[str, ...], on_duplicate_update: bool,
+                      row_count: int) -> str:
+    """Full multi-row INSERT for row_count rows, so every full batch reuses one string"""
+    base_sql, row_placeholder, update_sql = _insert_sql(table, columns, on_duplicate_update)
+    return base_sql + ', '.join([row_placeholder] * row_count) + update_sql
+
+
+@functools.lru_cache(maxsize=1024)
+def _with_cache_hint(sql: str) -> str:
+    """Rewrite a plain SELECT as SELECT SQL_CACHE, leaving other statements untouched"""
+    stripped = sql.lstrip()
+    if stripped[:7].upper() != 'SELECT ' or 'SQL_CACHE' in stripped.upper():
+        return sql
+    return 'SELECT SQL_CACHE ' + stripped[7:]
+
+
+# Escapes for the LOAD DATA default text format (tab-separated, backslash escapes)
+_INFILE_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+
+
+def _infile_value(value: Any) -> str:
+    """Encode one value for LOAD DATA INFILE; None becomes \\N (SQL NULL)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode('utf-8')
+    return str(value).translate(_INFILE_ESCAPES)
+
+
+class _ConnectionPool:
+    """
+    Minimal pool of raw mysql.connector connections
+    
+    Idle connections sit in a deque (append/popleft are atomic under the GIL)
+    and a semaphore counts free slots, so checkout and return take no
+    pool-wide lock. A connection is only pinged when it has been idle for
+    more than idle_check seconds; one that fails (wait_timeout, server
+    restart) is replaced by a fresh connection. Connections are opened
+    lazily up to pool_size; callers discard() connections that turned out
+    broken. Connections returned after close() are closed, not kept.
+    """
+    
+    def __init__(self, pool_size: int, connect_args: Mapping[str, Any],
+                 idle_check: float = 30.0):
+        self.pool_size = pool_size
+        self.idle_check = idle_check
+        self._connect_args = connect_args
+        self._idle = deque()  # (connection, returned_at)
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._closed = False
+    
+    @property
+    def in_use(self) -> int:
+        """Number of connections currently checked out"""
+        # Every checkout holds one semaphore permit, so the permits taken
+        # are the connections in use, with no extra bookkeeping per call
+        return self.pool_size - self._slots._value
+    
+    @property
+    def idle(self) -> int:
+        """Number of open connections waiting for reuse"""
+        return len(self._idle)
+    
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Take a connection, opening a new one if none is idle
+        
+        Args:
+            timeout: Seconds to wait for a free slot; 0 fails immediately
+                and None waits indefinitely
+                
+        Raises:
+            PoolError: No slot became free within timeout
+        """
+        if not self._slots.acquire(timeout != 0, timeout if timeout else None):
+            raise PoolError("Failed getting connection; pool exhausted")
+        try:
+            try:
+                connection, returned_at = self._idle.popleft()
+            except IndexError:
+                pass
+            else:
+                if time.monotonic() - returned_at < self.idle_check:
+                    return connection
+                try:
+                    connection.ping(reconnect=False)
+                    return connection
+                except Error:
+                    self._close_quietly(connection)  # Stale; fall through to a fresh one
+            
+            return mysql.connector.connect(**self._connect_args)
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    def release(self, connection) -> None:
+        """Return a healthy connection for reuse"""
+        if self._closed:
+            self._close_quietly(connection)
+        else:
+            self._idle.append((connection, time.monotonic()))
+        self._slots.release()
+    
+    def discard(self, connection) -> None:
+        """Close a broken connection and free its slot"""
+        self._close_quietly(connection)
+        self._slots.release()
+    
+    def close(self) -> None:
+        """Close every idle connection; borrowed ones are closed when returned"""
+        self._closed = True
+        while self._idle:
+            self._close_quietly(self._idle.popleft()[0])
+    
+    @staticmethod
+    def _close_quietly(connection) -> None:
+        try:
+            connection.close()
+        except Error:
+            pass
+
+
+# Queued by close() to stop the audit writer thread
+_AUDIT_STOP = object()
+
+
+# Business-logic SQL, built once so every call sends the identical statement
+# text and hits the prepared-statement and result caches
+_CUSTOMER_ORDER_SUMMARY_SQL: Final[str] = """
+    SELECT 
+        customer_id,
+        customer_email,
+        customer_name,
+        total_orders,
+        total_spent,
+        avg_order_value,
+        customer_segment,
+        last_order_date,
+        days_since_last_order
+    FROM customer_order_summary 
+    WHERE customer_id = %s
+"""
+
+_PRODUCT_INVENTORY_SELECT: Final[str] = """
+    SELECT 
+        product_id,
+        sku,
+        product_name,
+        system_stock,
+        calculated_stock,
+        reorder_level,
+        stock_status
+    FROM product_inventory
+"""
+_PRODUCT_INVENTORY_SQL: Final[str] = _PRODUCT_INVENTORY_SELECT + " ORDER BY product_name"
+_PRODUCT_INVENTORY_BY_SKU_SQL: Final[str] = _PRODUCT_INVENTORY_SELECT + " WHERE sku = %s ORDER BY product_name"
+
+_DAILY_SALES_SUMMARY_SQL: Final[str] = """
+    SELECT 
+        summary_date,
+        total_orders,
+        total_order_value,
+        avg_order_value,
+        total_customers,
+        new_customers,
+        day_of_week,
+        is_weekend
+    FROM daily_sales_summary
+    WHERE summary_date BETWEEN %s AND %s
+    ORDER BY summary_date DESC
+"""
+
+
 class DatabaseManager:
     """
     Enterprise-grade MySQL database manager with connection pooling,
@@ -173,11 +631,28 @@ class DatabaseManager:
     """
     
     def __init__(self, config: DatabaseConfig):
+        _load_driver()
         self.config = config
         self.pool = None
+        # Connections with multi-statement support, used only by
+        # execute_transaction so no other caller can stack statements
+        self._transaction_pool = None
+        self._pool_config: Optional[Mapping[str, Any]] = None
         self.metrics = QueryMetrics()
+        self._max_packet = 4 * 1024 * 1024  # Replaced by the server value in initialize()
+        self._per_table_batch: Dict[str, int] = {}  # Learned adaptive batch size per table
+        self._last_health: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        
+        # Audit rows waiting for the background writer thread
+        self._audit_queue = queue.SimpleQueue()
+        self._audit_flush_thread = None
+        self.result_cache = QueryCache(config.query_cache_size, config.query_cache_ttl)
         self.is_connected = False
         
+        # Fan-out executor for independent queries; each worker borrows its
+        # own connection. Created by initialize(), shut down by close()
+        self._executor = None
+        
         # Audit context for tracking operations
         self.audit_context = {
             'application_name': config.application_name,
@@ -185,50 +660,119 @@ class DatabaseManager:
             'version': config.version,
             'session_id': f"python_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         }
+        
+        # Audit variables never change for the lifetime of the manager
+        self._audit_params = (
+            config.user,
+            self.audit_context['application_name'],
+            self.audit_context['session_id'],
+            self.audit_context['environment']
+        )
+        
+        # Pool description reported by health_check (static for the manager's lifetime)
+        self._pool_status = {
+            'pool_name': config.pool_name,
+            'pool_size': config.pool_size,
+            'host': config.host,
+            'database': config.database,
+            'user': config.user
+        }
+        
+        self._pool_exhaustions = _Counter()
+        self._pool_wait_time = _Counter(0.0)  # Seconds spent waiting on an exhausted pool
+        
+        # Physical connections that already carry the audit variables
+        self._initialized_conns = weakref.WeakSet()
+        
+        # Prepared cursors per physical connection: {connection: {sql: cursor}}.
+        # Session reset deallocates server-side statements, so they are
+        # only kept when the pool does not reset sessions.
+        self._statement_cache = weakref.WeakKeyDictionary()
+        # One long-lived buffered cursor per physical connection: {connection: cursor}
+        self._cursor_cache = weakref.WeakKeyDictionary()
+        self._statement_lock = threading.Lock()
+        self._prepared_hits = _Counter()
+        self._prepared_misses = _Counter()
+        self._use_prepared = config.prepared_statements and not config.pool_reset_session
+        
+        # Row classes per result column layout: {column names: namedtuple class}
+        self._row_class_cache: Dict[Tuple[str, ...], type] = {}
+        # Result column names per SQL string, so repeated queries skip
+        # rebuilding them from cursor.description
+        self._desc_cache: Dict[str, Tuple[str, ...]] = {}
+    
+    def _build_pool_config(self) -> Mapping[str, Any]:
+        """Build the pooled connections' connect() arguments once per manager (read-only view)"""
+        if self._pool_config is not None:
+            return self._pool_config
+        
+        pool_config = {
+            'host': self.config.host,
+            'port': self.config.port,
+            'database': self.config.database,
+            'user': self.config.user,
+            'password': self.config.password,
+            'autocommit': self.config.autocommit,
+            'charset': self.config.charset,
+            'collation': self.config.collation,
+            'time_zone': self.config.time_zone,
+            'connection_timeout': self.config.connection_timeout,
+            'auth_plugin': self.config.auth_plugin,
+            # Probe for the C extension instead of failing over inside connect()
+            'use_pure': self.config.use_pure or not getattr(mysql.connector, 'HAVE_CEXT', False),
+            'compress': self.config.compress,
+            'allow_local_infile': self.config.allow_local_infile
+        }
+        
+        # Add SSL configuration if not disabled
+        if not self.config.ssl_disabled:
+            ssl_config = {}
+            if self.config.ssl_ca:
+                ssl_config['ca'] = self.config.ssl_ca
+            if self.config.ssl_cert:
+                ssl_config['cert'] = self.config.ssl_cert
+            if self.config.ssl_key:
+                ssl_config['key'] = self.config.ssl_key
+            
+            if ssl_config:
+                pool_config['ssl'] = ssl_config
+        
+        self._pool_config = MappingProxyType(pool_config)
+        return self._pool_config
     
     def initialize(self) -> None:
         """Initialize database connection pool"""
         try:
-            pool_config = {
-                'pool_name': self.config.pool_name,
-                'pool_size': self.config.pool_size,
-                'pool_reset_session': self.config.pool_reset_session,
-                'host': self.config.host,
-                'port': self.config.port,
-                'database': self.config.database,
-                'user': self.config.user,
-                'password': self.config.password,
-                'autocommit': self.config.autocommit,
-                'charset': self.config.charset,
-                'collation': self.config.collation,
-                'time_zone': self.config.time_zone,
-                'connection_timeout': self.config.connection_timeout,
-                'auth_plugin': self.config.auth_plugin
-            }
-            
-            # Add SSL configuration if not disabled
-            if not self.config.ssl_disabled:
-                ssl_config = {}
-                if self.config.ssl_ca:
-                    ssl_config['ca'] = self.config.ssl_ca
-                if self.config.ssl_cert:
-                    ssl_config['cert'] = self.config.ssl_cert
-                if self.config.ssl_key:
-                    ssl_config['key'] = self.config.ssl_key
-                
-                if ssl_config:
-                    pool_config['ssl'] = ssl_config
-            
-            self.pool = pooling.MySQLConnectionPool(**pool_config)
+            pool_config = self._build_pool_config()
+            # Reads run in autocommit, so a SELECT opens no transaction that
+            # would need a ROLLBACK round trip when the connection is returned;
+            # batch_insert starts its own transaction to stay atomic
+            self.pool = _ConnectionPool(self.config.pool_size, MappingProxyType(
+                {**pool_config, 'autocommit': True}
+            ), self.config.pool_idle_check)
+            # Opened lazily, so this costs nothing until the first transaction
+            self._transaction_pool = _ConnectionPool(self.config.pool_size, MappingProxyType(
+                {**pool_config, 'client_flags': [ClientFlag.MULTI_STATEMENTS]}
+            ), self.config.pool_idle_check)
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.config.max_parallel or self.config.pool_size,
+                thread_name_prefix=f"{self.config.pool_name}_query"
+            )
             
             # Test connection
             self._test_connection()
             
             self.is_connected = True
-            logger.info(f"Database connection pool initialized: {self.config.host}:{self.config.port}/{self.config.database}")
+            self._max_packet = self._get_max_allowed_packet()
+            
+            self._audit_flush_thread = threading.Thread(
+                target=self._audit_flusher, name=f"{self.config.pool_name}_audit", daemon=True
+            )
+            self._audit_flush_thread.start()
+            logger.info("Database connection pool initialized: %s:%s/%s", self.config.host, self.config.port, self.config.database)
             
         except Error as e:
-            logger.error(f"Failed to initialize database pool: {e}")
+            logger.error("Failed to initialize database pool: %s", e)
             raise
     
     def _test_connection(self) -> None:
@@ -241,42 +785,188 @@ class DatabaseManager:
                 cursor.close()
             logger.info("Database connection test successful")
         except Error as e:
-            logger.error(f"Database connection test failed: {e}")
+            logger.error("Database connection test failed: %s", e)
             raise
     
-    @contextmanager
+    def _ping(self) -> None:
+        """
+        Liveness probe for health_check: a COM_PING on a pooled connection,
+        with no statement to parse, no result set and no logging
+        """
+        with self.get_connection() as connection:
+            connection.ping(reconnect=False)
+    
+    def _prepared_cursor(self, connection, sql: str):
+        """
+        Return a prepared cursor for sql on this connection, preparing it on
+        first use. The driver skips COM_STMT_PREPARE when a prepared cursor
+        executes the same statement again.
+        """
+        statements = self._statement_cache.get(connection)
+        if statements is None:
+            with self._statement_lock:
+                statements = self._statement_cache.setdefault(connection, OrderedDict())
+        
+        cursor = statements.get(sql)
+        if cursor is not None:
+            self._prepared_hits.increment()
+            statements.move_to_end(sql)
+            return cursor
+        
+        self._prepared_misses.increment()
+        cursor = connection.cursor(prepared=True)
+        statements[sql] = cursor
+        if len(statements) > self.config.prepared_cache_size:
+            _, evicted = statements.popitem(last=False)
+            evicted.close()
+        return cursor
+    
+    def _cursor(self, connection):
+        """
+        Return the buffered cursor attached to this physical connection,
+        creating it on first use. Re-executing a buffered cursor discards
+        any rows left from its previous statement.
+        """
+        cursor = self._cursor_cache.get(connection)
+        if cursor is None:
+            cursor = connection.cursor(buffered=True)
+            with self._statement_lock:
+                self._cursor_cache[connection] = cursor
+        return cursor
+    
+    def _drop_cursors(self, connection) -> None:
+        """
+        Close the cached cursors of a connection that raised, so its
+        server-side prepared statements don't outlive the cache entry when
+        the connection goes back to the pool
+        """
+        cursors = list(self._statement_cache.pop(connection, {}).values())
+        cursor = self._cursor_cache.pop(connection, None)
+        if cursor is not None:
+            cursors.append(cursor)
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except Error:
+                pass  # Connection already broken; it will be discarded
+    
+    def _get_max_allowed_packet(self) -> int:
+        """Read max_allowed_packet so batch inserts can stay below it"""
+        with self.get_connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute("SHOW VARIABLES LIKE 'max_allowed_packet'")
+            row = cursor.fetchone()
+            cursor.close()
+        return int(row[1]) if row else self._max_packet
+    
+    def _row_factory(self, cursor, row_factory: str, sql: Optional[str] = None):
+        """
+        Return a callable converting positional rows for the cursor's result
+        
+        row_factory selects namedtuples (attribute access, one shared class
+        per column layout), plain dictionaries ('dict'), or None for 'tuple',
+        meaning the driver's rows are returned unconverted. Column names are
+        memoized per sql when it is given.
+        """
+        if row_factory == 'tuple':
+            return None
+        if row_factory not in ('namedtuple', 'dict'):
+            raise ValueError(f"Unknown row_factory: {row_factory}")
+        
+        columns = self._desc_cache.get(sql) if sql is not None else None
+        if columns is None:
+            columns = tuple(desc[0] for desc in cursor.description)
+            if sql is not None:
+                if len(self._desc_cache) >= 1024:
+                    self._desc_cache.clear()  # Bound memory for ad-hoc SQL
+                self._desc_cache[sql] = columns
+        if row_factory == 'dict':
+            return lambda row: dict(zip(columns, row))
+        
+        row_class = self._row_class_cache.get(columns)
+        if row_class is None:
+            row_class = self._row_class_cache.setdefault(
+                columns, namedtuple('Row', columns, rename=True)
+            )
+        return row_class._make
+    
+    def _checkout(self, pool: '_ConnectionPool'):
+        """
+        Take a connection from pool, waiting up to config.pool_wait_timeout
+        for one to be returned when the pool is exhausted
+        """
+        try:
+            return pool.acquire(timeout=0)
+        except PoolError:
+            pass
+        
+        self._pool_exhaustions.increment()
+        wait_start = time.perf_counter()
+        try:
+            return pool.acquire(timeout=self.config.pool_wait_timeout)
+        finally:
+            self._pool_wait_time.increment(time.perf_counter() - wait_start)
+    
+    def _return_connection(self, pool: '_ConnectionPool', connection, failed: bool) -> None:
+        """Give a connection back to its pool, or discard it if it is unusable"""
+        try:
+            # Without a session reset an open transaction would leak to the
+            # next borrower (this also covers abandoned streams); reads run in
+            # autocommit, so this only fires after explicit transactions
+            if failed or connection.in_transaction:
+                connection.rollback()
+            if self.config.pool_reset_session:
+                connection.reset_session()
+        except Error:
+            pool.discard(connection)
+        else:
+            pool.release(connection)
+    
     def get_connection(self):
         """
         Context manager for database connections with audit context setup
         """
-        if not self.is_connected:
+        return self._connection(self.pool)
+    
+    @contextmanager
+    def _connection(self, pool: Optional['_ConnectionPool']):
+        """Check a connection out of pool for the duration of a with block"""
+        if not self.is_connected or pool is None:
             raise RuntimeError("Database not initialized. Call initialize() first.")
         
         connection = None
+        failed = False
         try:
-            connection = self.pool.get_connection()
+            connection = self._checkout(pool)
             
-            # Set audit context variables
-            cursor = connection.cursor()
-            cursor.execute("SET @audit_user = %s", (self.config.user,))
-            cursor.execute("SET @audit_app = %s", (self.audit_context['application_name'],))
-            cursor.execute("SET @audit_session = %s", (self.audit_context['session_id'],))
-            cursor.execute("SET @audit_env = %s", (self.audit_context['environment'],))
-            cursor.close()
+            # Set audit context variables once per physical connection;
+            # they survive checkouts unless the pool resets the session
+            if self.config.pool_reset_session or connection not in self._initialized_conns:
+                cursor = connection.cursor()
+                cursor.execute(
+                    "SET @audit_user = %s, @audit_app = %s, @audit_session = %s, @audit_env = %s",
+                    self._audit_params
+                )
+                cursor.close()
+                self._initialized_conns.add(connection)
             
             yield connection
             
         except Error as e:
-            if connection:
-                connection.rollback()
-            logger.error(f"Database connection error: {e}")
+            failed = True
+            if connection is not None:
+                self._initialized_conns.discard(connection)
+                self._drop_cursors(connection)
+            logger.error("Database connection error: %s", e)
             raise
         finally:
-            if connection:
-                connection.close()
+            if connection is not None:
+                self._return_connection(pool, connection, failed)
     
     def execute_query(self, sql: str, params: Optional[Tuple] = None, 
-                     fetch_all: bool = True) -> Tuple[List, float]:
+                     fetch_all: bool = True, use_cache: bool = False,
+                     row_factory: str = 'namedtuple',
+                     prepared: Optional[bool] = None) -> Tuple[List, float]:
         """
         Execute SQL query with performance monitoring
         
@@ -284,91 +974,230 @@ class DatabaseManager:
             sql: SQL query string
             params: Query parameters
             fetch_all: Whether to fetch all results
+            use_cache: Serve repeated SELECTs from the result cache
+                (cached results are shared and must be treated as read-only)
+            row_factory: Row type: 'namedtuple', 'dict' or 'tuple' (cheapest,
+                no per-row conversion)
+            prepared: Force (True) or skip (False) a server-side prepared
+                statement; by default only parameterised statements are prepared
             
         Returns:
             Tuple of (results, execution_time)
         """
-        start_time = time.time()
+        cache_key = None
+        if use_cache:
+            cache_key = self.result_cache.make_key(sql, (params, fetch_all, row_factory))
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached, 0.0
+        
+        start_time = time.perf_counter()
         success = True
         results = []
+        statement = _with_cache_hint(sql) if self.config.query_cache_hint else sql
         
         try:
             with self.get_connection() as connection:
-                cursor = connection.cursor(dictionary=True)
-                cursor.execute(sql, params or ())
+                # Parameterised statements are prepared once per connection
+                # and re-executed over the binary protocol
+                if prepared is None:
+                    prepared = bool(params)
+                prepared = prepared and self._use_prepared
+                if prepared:
+                    cursor = self._prepared_cursor(connection, statement)
+                else:
+                    cursor = self._cursor(connection)
+                cursor.execute(statement, params or ())
                 
                 if cursor.description:  # SELECT query
-                    results = cursor.fetchall() if fetch_all else cursor.fetchone()
+                    make_row = self._row_factory(cursor, row_factory, sql)
+                    if fetch_all:
+                        results = cursor.fetchall()
+                        if make_row is not None:
+                            results = [make_row(row) for row in results]
+                    else:
+                        results = cursor.fetchone()
+                        if make_row is not None and results is not None:
+                            results = make_row(results)
+                        if prepared:
+                            cursor.fetchall()  # Drain so the cursor can be re-executed
+                    if cache_key is not None and results is not None:
+                        self.result_cache.put(cache_key, sql, results)
                 else:  # INSERT/UPDATE/DELETE
                     results = {
                         'affected_rows': cursor.rowcount,
                         'last_insert_id': cursor.lastrowid
                     }
-                
-                cursor.close()
+                    # Drop cached reads of the table just written
+                    match = _WRITE_TABLE_RE.match(sql)
+                    if match:
+                        self.result_cache.invalidate(match.group(1))
                 
         except Error as e:
             success = False
-            logger.error(f"Query execution failed: {e}")
-            logger.error(f"SQL: {sql}")
-            logger.error(f"Params: {params}")
+            logger.error("Query execution failed: %s", e)
+            logger.error("SQL: %s", sql)
+            logger.error("Params: %s", params)
             raise
         finally:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.metrics.record_query(sql, execution_time, success)
         
         return results, execution_time
     
-    def execute_transaction(self, queries: List[Tuple[str, Optional[Tuple]]]) -> Dict[str, Any]:
+    def execute_query_stream(self, sql: str, params: Optional[Tuple] = None,
+                             row_factory: str = 'namedtuple') -> Iterator[Tuple]:
         """
-        Execute multiple queries in a transaction
+        Execute a SELECT and yield rows as they arrive from the server
+        
+        Uses an unbuffered cursor read in config.stream_fetch_size chunks, so
+        memory stays bounded to one chunk and the first rows are available
+        before the server finishes sending. Unlike execute_query this gives
+        up the single bulk fetch for first-row latency and bounded memory.
+        The pooled connection is held until the generator is exhausted or
+        closed.
+        
+        Args:
+            sql: SQL query string
+            params: Query parameters
+            row_factory: Row type: 'namedtuple', 'dict' or 'tuple'
+            
+        Yields:
+            Result rows
+        """
+        start_time = time.perf_counter()
+        success = True
+        
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor(buffered=False)
+                try:
+                    cursor.execute(sql, params or ())
+                    make_row = self._row_factory(cursor, row_factory, sql)
+                    fetch_size = self.config.stream_fetch_size
+                    while True:
+                        chunk = cursor.fetchmany(fetch_size)
+                        if not chunk:
+                            break
+                        if make_row is None:
+                            yield from chunk
+                        else:
+                            for row in chunk:
+                                yield make_row(row)
+                finally:
+                    # An abandoned stream leaves rows on the wire; discard them
+                    # before the connection goes back to the pool
+                    if connection.unread_result:
+                        connection.consume_results()
+                    cursor.close()
+        
+        except Error as e:
+            success = False
+            logger.error("Streaming query failed: %s", e)
+            logger.error("SQL: %s", sql)
+            raise
+        finally:
+            self.metrics.record_query(sql, time.perf_counter() - start_time, success)
+    
+    def execute_parallel(self, queries: List[Tuple[str, Optional[Tuple]]],
+                         use_cache: bool = False) -> List[Tuple[List, float]]:
+        """
+        Execute independent queries concurrently on separate pooled connections
+        
+        Wall-clock time is bounded by the slowest query instead of the sum.
         
         Args:
             queries: List of (sql, params) tuples
+            use_cache: Passed through to execute_query
             
         Returns:
-            Transaction execution summary
+            List of (results, execution_time) in the same order as queries
+        """
+        if self._executor is None:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        
+        futures = [
+            self._executor.submit(self.execute_query, sql, params, use_cache=use_cache)
+            for sql, params in queries
+        ]
+        return [future.result() for future in futures]
+    
+    def execute_transaction(self, queries: List[Tuple[str, Optional[Tuple]]],
+                            row_factory: str = 'tuple') -> Dict[str, Any]:
         """
-        start_time = time.time()
+        Execute multiple queries in a transaction
+        
+        The statements are sent as a single multi-statement request
+        (START TRANSACTION; ...; COMMIT), so the whole transaction costs one
+        network round trip. The server stops at the first failing statement,
+        which leaves COMMIT unexecuted and the transaction is rolled back.
+        
+        Args:
+            queries: List of (sql, params) tuples. A LAST_INSERT_ID parameter
+                refers to the id generated by the preceding INSERT.
+            row_factory: Row type for SELECT results: 'tuple' (default, no
+                per-row conversion), 'namedtuple' or 'dict'
+            
+        Returns:
+            Transaction execution summary. Per-query execution_time is the
+            time between consecutive result sets arriving from the server.
+        """
+        start_time = time.perf_counter()
         results = []
         
+        spliced = [_splice_last_insert_id(sql, params) for sql, params in queries]
+        statements = [sql.strip().rstrip(';') for sql, _ in spliced]
+        combined_sql = ';\n'.join(['START TRANSACTION'] + statements + ['COMMIT'])
+        combined_params = tuple(itertools.chain.from_iterable(params for _, params in spliced))
+        
         try:
-            with self.get_connection() as connection:
-                cursor = connection.cursor(dictionary=True)
+            with self._connection(self._transaction_pool) as connection:
+                cursor = connection.cursor()
                 
-                # Begin transaction
-                connection.start_transaction()
+                query_start = time.perf_counter()
+                result_sets = cursor.execute(combined_sql, combined_params, multi=True)
                 
-                for sql, params in queries:
-                    query_start = time.time()
-                    cursor.execute(sql, params or ())
+                # Result sets arrive in statement order: START TRANSACTION,
+                # each query, then COMMIT
+                for index, result_cursor in enumerate(result_sets):
+                    if index == 0 or index > len(queries):
+                        continue
                     
-                    if cursor.description:
-                        result = cursor.fetchall()
+                    if result_cursor.with_rows:
+                        make_row = self._row_factory(result_cursor, row_factory)
+                        result = result_cursor.fetchall()
+                        if make_row is not None:
+                            result = [make_row(row) for row in result]
                     else:
                         result = {
-                            'affected_rows': cursor.rowcount,
-                            'last_insert_id': cursor.lastrowid
+                            'affected_rows': result_cursor.rowcount,
+                            'last_insert_id': result_cursor.lastrowid
                         }
                     
+                    arrived = time.perf_counter()
                     results.append({
-                        'sql': sql,
+                        'sql': queries[index - 1][0],
                         'result': result,
-                        'execution_time': time.time() - query_start
+                        'execution_time': arrived - query_start
                     })
+                    query_start = arrived
                 
-                # Commit transaction
-                connection.commit()
                 cursor.close()
                 
-                logger.info(f"Transaction completed successfully with {len(queries)} queries")
+                # Drop cached reads of every table written by the transaction
+                for sql, _ in queries:
+                    match = _WRITE_TABLE_RE.match(sql)
+                    if match:
+                        self.result_cache.invalidate(match.group(1))
+                
+                logger.info("Transaction completed successfully with %s queries", len(queries))
                 
         except Error as e:
-            connection.rollback()
-            logger.error(f"Transaction failed, rolled back: {e}")
+            # get_connection has already rolled the connection back
+            logger.error("Transaction failed, rolled back: %s", e)
             raise
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         return {
             'success': True,
             'total_execution_time': total_time,
@@ -377,7 +1206,7 @@ class DatabaseManager:
         }
     
     def batch_insert(self, table: str, columns: List[str], rows: List[Tuple], 
-                    batch_size: int = 1000, on_duplicate_update: bool = False) -> Dict[str, Any]:
+                    batch_size: Optional[int] = None, on_duplicate_update: bool = False) -> Dict[str, Any]:
         """
         Perform batch insert operation
         
@@ -385,7 +1214,8 @@ class DatabaseManager:
             table: Target table name
             columns: Column names
             rows: Row data
-            batch_size: Number of rows per batch
+            batch_size: Fixed number of rows per batch; None adapts the size
+                per table (AIMD toward config.batch_target_latency_ms)
             on_duplicate_update: Use ON DUPLICATE KEY UPDATE
             
         Returns:
@@ -394,42 +1224,71 @@ class DatabaseManager:
         if not rows:
             raise ValueError("No data provided for batch insert")
         
+        # Very large plain inserts go through LOAD DATA LOCAL INFILE instead
+        if (self.config.allow_local_infile and not on_duplicate_update
+                and len(rows) > self.config.bulk_load_threshold):
+            return self.bulk_load(table, columns, rows)
+        
         total_inserted = 0
         batches_processed = 0
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Create base query
-            placeholders = ', '.join(['%s'] * len(columns))
-            base_sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            # One multi-row statement carries a whole batch
+            column_key = tuple(columns)
+            row_placeholder = _insert_sql(table, column_key, on_duplicate_update)[1]
             
-            if on_duplicate_update:
-                update_clause = ', '.join([f"{col} = VALUES({col})" for col in columns])
-                base_sql += f" ON DUPLICATE KEY UPDATE {update_clause}"
+            packet_budget = int(self._max_packet * 0.9)
+            max_rows = max(1, _MAX_PLACEHOLDERS // len(columns))
+            adaptive = batch_size is None
+            if adaptive:
+                batch_size = self._per_table_batch.get(table, 1000)
+            target_latency = self.config.batch_target_latency_ms / 1000
             
             with self.get_connection() as connection:
-                cursor = connection.cursor()
+                cursor = self._cursor(connection)
+                connection.start_transaction()  # The pool runs in autocommit
                 
                 # Process in batches
-                for i in range(0, len(rows), batch_size):
-                    batch = rows[i:i + batch_size]
+                i = 0
+                while i < len(rows):
+                    # Shrink the batch if it would exceed max_allowed_packet or the
+                    # placeholder limit, estimating row size from the first row
+                    row_bytes = len(row_placeholder) + sum(len(str(value)) + 3 for value in rows[i])
+                    current_size = max(1, min(batch_size, max_rows, packet_budget // row_bytes))
+                    batch = rows[i:i + current_size]
                     
-                    cursor.executemany(base_sql, batch)
+                    sql = _insert_statement(table, column_key, on_duplicate_update, len(batch))
+                    batch_start = time.perf_counter()
+                    cursor.execute(sql, list(itertools.chain.from_iterable(batch)))
+                    batch_time = time.perf_counter() - batch_start
                     total_inserted += cursor.rowcount
                     batches_processed += 1
+                    i += len(batch)
+                    
+                    # Grow fast batches, halve slow ones (never below 50 rows);
+                    # the packet limit above caps the growth
+                    if adaptive:
+                        if batch_time < 0.5 * target_latency and len(batch) == batch_size:
+                            batch_size *= 2
+                        elif batch_time > 2 * target_latency:
+                            batch_size = max(50, batch_size // 2)
                     
                     if batches_processed % 10 == 0:
-                        logger.info(f"Batch insert progress: {i + len(batch)}/{len(rows)} rows")
+                        logger.info("Batch insert progress: %s/%s rows", i, len(rows))
                 
                 connection.commit()
-                cursor.close()
+            
+            if adaptive:
+                self._per_table_batch[table] = batch_size
+            self.result_cache.invalidate(table)
                 
         except Error as e:
-            logger.error(f"Batch insert failed for table {table}: {e}")
+            logger.error("Batch insert failed for table %s: %s", table, e)
             raise
         
-        execution_time = time.time() - start_time
-        logger.info(f"Batch insert completed: {total_inserted} rows in {execution_time:.2f}s")
+        execution_time = time.perf_counter() - start_time
+        logger.info("Batch insert completed: %s rows in %.2fs", total_inserted, execution_time)
         
         return {
             'table': table,
@@ -439,123 +1298,590 @@ class DatabaseManager:
             'execution_time': execution_time
         }
     
+    def bulk_load(self, table: str, columns: List[str], rows: List[Tuple]) -> Dict[str, Any]:
+        """
+        Load rows with LOAD DATA LOCAL INFILE
+        
+        Rows are written to a temporary file in MySQL's default
+        tab-separated format, and the server ingests them as a single bulk
+        stream with no per-value parameter conversion. Requires
+        config.allow_local_infile and local_infile enabled on the server.
+        
+        Args:
+            table: Target table name
+            columns: Column names
+            rows: Row data
+            
+        Returns:
+            Insert operation summary
+        """
+        start_time = time.perf_counter()
+        sql = (f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+               f"({', '.join(columns)})")
+        
+        data_file = tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='\n',
+                                                suffix='.tsv', delete=False)
+        try:
+            # Written inside the try so a failed write never leaves row data behind
+            with data_file:
+                for row in rows:
+                    data_file.write('\t'.join(map(_infile_value, row)) + '\n')
+            
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(sql, (data_file.name,))
+                total_inserted = cursor.rowcount
+                connection.commit()
+                cursor.close()
+            
+            self.result_cache.invalidate(table)
+        
+        except Error as e:
+            logger.error("Bulk load failed for table %s: %s", table, e)
+            raise
+        finally:
+            os.remove(data_file.name)
+        
+        execution_time = time.perf_counter() - start_time
+        logger.info("Bulk load completed: %s rows in %.2fs", total_inserted, execution_time)
+        
+        return {
+            'table': table,
+            'total_rows': len(rows),
+            'inserted_rows': total_inserted,
+            'batches_processed': 1,
+            'execution_time': execution_time
+        }
+    
+    def log_audit(self, table_name: str, operation: str, record_id: Any,
+                  changed_by: Optional[str] = None) -> None:
+        """
+        Queue an audit log entry for the background writer
+        
+        The call only enqueues (no lock, no I/O). The writer batches entries
+        arriving within config.audit_flush_interval of each other, up to
+        config.audit_flush_rows, into one multi-row INSERT. close() drains
+        the queue.
+        
+        Args:
+            table_name: Table that was modified
+            operation: INSERT, UPDATE or DELETE
+            record_id: Primary key of the affected record
+            changed_by: User who made the change (defaults to the database user)
+        """
+        self._audit_queue.put((
+            table_name,
+            operation,
+            str(record_id),
+            changed_by or self.config.user,
+            self.audit_context['session_id'],
+            self.audit_context['application_name']
+        ))
+    
+    def _audit_flusher(self) -> None:
+        """Background writer: sleeps while idle, then batches one flush window"""
+        while True:
+            entry = self._audit_queue.get()
+            if entry is _AUDIT_STOP:
+                return
+            
+            rows = [entry]
+            stopping = False
+            deadline = time.monotonic() + self.config.audit_flush_interval
+            while len(rows) < self.config.audit_flush_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._audit_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _AUDIT_STOP:
+                    stopping = True
+                    break
+                rows.append(entry)
+            
+            self._write_audit_rows(rows)
+            if stopping:
+                return
+    
+    def _drain_audit_queue(self) -> None:
+        """Write every audit row still queued as one batch insert"""
+        rows = []
+        while True:
+            try:
+                entry = self._audit_queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not _AUDIT_STOP:
+                rows.append(entry)
+        if rows:
+            self._write_audit_rows(rows)
+    
+    def _write_audit_rows(self, rows: List[Tuple]) -> None:
+        """Insert audit rows, logging rather than raising on failure"""
+        try:
+            self.batch_insert(
+                'audit_log',
+                ['table_name', 'operation', 'record_id', 'changed_by', 'session_id', 'application_name'],
+                rows
+            )
+        except Exception as e:
+            logger.error("Failed to flush %s audit log entries: %s", len(rows), e)
+    
     # Business logic methods
     
-    def get_customer_order_summary(self, customer_id: int) -> Optional[Dict]:
-        """Get customer order summary"""
-        sql = """
-        SELECT 
-            customer_id,
-            customer_email,
-            customer_name,
-            total_orders,
-            total_spent,
-            avg_order_value,
-            customer_segment,
-            last_order_date,
-            days_since_last_order
-        FROM customer_order_summary 
-        WHERE customer_id = %s
-        """
-        
-        results, _ = self.execute_query(sql, (customer_id,), fetch_all=False)
+    # The reporting tables below are written by other processes (the ETL
+    # pipeline), which the in-process result cache cannot see, so caching
+    # is opt-in: only pass use_cache=True when config.query_cache_ttl of
+    # staleness is acceptable.
+    
+    def get_customer_order_summary(self, customer_id: int,
+                                   use_cache: bool = False) -> Optional[Tuple]:
+        """
+        Get customer order summary
+        
+        Args:
+            customer_id: Customer to look up
+            use_cache: Serve repeated lookups from the result cache
+        """
+        results, _ = self.execute_query(_CUSTOMER_ORDER_SUMMARY_SQL, (customer_id,),
+                                        fetch_all=False, use_cache=use_cache)
         return results
     
-    def get_product_inventory(self, sku: Optional[str] = None) -> List[Dict]:
-        """Get product inventory status"""
-        sql = """
-        SELECT 
-            product_id,
-            sku,
-            product_name,
-            system_stock,
-            calculated_stock,
-            reorder_level,
-            stock_status
-        FROM product_inventory
-        """
-        
-        params = ()
+    def get_product_inventory(self, sku: Optional[str] = None,
+                              stream: bool = False, use_cache: bool = False) -> List[Tuple]:
+        """
+        Get product inventory status
+        
+        Args:
+            sku: Optional SKU filter
+            stream: Return a row generator instead of a list (large catalogs)
+            use_cache: Serve repeated lookups from the result cache
+        """
         if sku:
-            sql += " WHERE sku = %s"
-            params = (sku,)
+            sql, params = _PRODUCT_INVENTORY_BY_SKU_SQL, (sku,)
+        else:
+            sql, params = _PRODUCT_INVENTORY_SQL, ()
         
-        sql += " ORDER BY product_name"
+        if stream:
+            return self.execute_query_stream(sql, params)
         
-        results, _ = self.execute_query(sql, params)
+        results, _ = self.execute_query(sql, params, use_cache=use_cache)
         return results
     
-    def get_daily_sales_summary(self, start_date: str, end_date: str) -> List[Dict]:
-        """Get daily sales summary for date range"""
-        sql = """
-        SELECT 
-            summary_date,
-            total_orders,
-            total_order_value,
-            avg_order_value,
-            total_customers,
-            new_customers,
-            day_of_week,
-            is_weekend
-        FROM daily_sales_summary
-        WHERE summary_date BETWEEN %s AND %s
-        ORDER BY summary_date DESC
-        """
-        
-        results, _ = self.execute_query(sql, (start_date, end_date))
+    def get_daily_sales_summary(self, start_date: str, end_date: str,
+                                stream: bool = False, use_cache: bool = False) -> List[Tuple]:
+        """
+        Get daily sales summary for date range
+        
+        Args:
+            start_date: First summary date (inclusive)
+            end_date: Last summary date (inclusive)
+            stream: Return a row generator instead of a list (wide ranges)
+            use_cache: Serve repeated lookups from the result cache
+        """
+        if stream:
+            return self.execute_query_stream(_DAILY_SALES_SUMMARY_SQL, (start_date, end_date))
+        
+        results, _ = self.execute_query(_DAILY_SALES_SUMMARY_SQL, (start_date, end_date),
+                                        use_cache=use_cache)
         return results
     
     def health_check(self) -> Dict[str, Any]:
-        """Perform comprehensive health check"""
+        """
+        Perform comprehensive health check
+        
+        A healthy result is reused for config.health_check_ttl seconds so
+        frequent load-balancer probes don't each cost a pool checkout and a
+        round trip. Failures are never cached.
+        """
+        now = time.monotonic()
+        checked_at, last_result = self._last_health
+        if last_result is not None and now - checked_at < self.config.health_check_ttl:
+            return last_result
+        
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Test basic connectivity
-            self._test_connection()
-            connection_time = time.time() - start_time
-            
-            # Get pool status
-            pool_status = {
-                'pool_name': self.config.pool_name,
-                'pool_size': self.config.pool_size,
-                'host': self.config.host,
-                'database': self.config.database,
-                'user': self.config.user
-            }
+            self._ping()
+            connection_time = time.perf_counter() - start_time
             
             # Get performance metrics
             performance_stats = self.metrics.get_stats()
             
-            return {
+            result = {
                 'status': 'healthy',
                 'connection_time': connection_time,
-                'pool_status': pool_status,
+                'pool_status': self._pool_status,
                 'performance_stats': performance_stats,
                 'audit_context': self.audit_context,
                 'timestamp': datetime.now().isoformat()
             }
+            self._last_health = (now, result)
+            return result
             
         except Exception as e:
+            self._last_health = (0.0, None)
             return {
                 'status': 'unhealthy',
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
             }
     
+    def get_pool_status(self) -> Dict[str, Any]:
+        """Current connection pool usage, for monitoring"""
+        pool = self.pool
+        status = dict(self._pool_status)
+        status['in_use'] = pool.in_use if pool else 0
+        status['idle'] = pool.idle if pool else 0
+        status['pool_exhaustions'] = self._pool_exhaustions.value
+        status['pool_wait_time'] = self._pool_wait_time.value
+        return status
+    
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get detailed performance statistics"""
-        return self.metrics.get_stats()
+        stats = self.metrics.get_stats()
+        stats['cache_hits'] = self.result_cache.hits
+        stats['cache_misses'] = self.result_cache.misses
+        
+        prepared_hits = self._prepared_hits.value
+        prepared_requests = prepared_hits + self._prepared_misses.value
+        stats['prepared_hits'] = prepared_hits
+        stats['prepared_misses'] = self._prepared_misses.value
+        stats['prepared_hit_ratio'] = (
+            prepared_hits / prepared_requests * 100 if prepared_requests > 0 else 0
+        )
+        stats['pool_exhaustions'] = self._pool_exhaustions.value
+        stats['pool_wait_time'] = self._pool_wait_time.value
+        return stats
+    
+    def invalidate(self, table: Optional[str] = None) -> int:
+        """
+        Invalidate cached query results
+        
+        Args:
+            table: Only drop results that read from this table (None drops all)
+            
+        Returns:
+            Number of cache entries removed
+        """
+        return self.result_cache.invalidate(table)
     
     def close(self) -> None:
         """Close database connection pool"""
+        # Stop the flusher and write whatever is still buffered
+        if self._audit_flush_thread is not None:
+            self._audit_queue.put(_AUDIT_STOP)
+            self._audit_flush_thread.join()
+            self._audit_flush_thread = None
+        if self.is_connected:
+            self._drain_audit_queue()
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        if self._transaction_pool:
+            self._transaction_pool.close()
+            self._transaction_pool = None
         if self.pool:
-            # MySQL connector doesn't have explicit pool close method
-            # Connections will be closed when pool goes out of scope
+            self.pool.close()
             self.pool = None
             self.is_connected = False
             logger.info("Database connection pool closed")
 
 
+def _load_async_driver() -> SimpleNamespace:
+    """
+    Import the asyncio MySQL driver: asyncmy (Cython protocol, fastest) when
+    installed, otherwise aiomysql. Both expose the same pool/cursor API.
+    """
+    try:
+        import asyncmy
+        from asyncmy.cursors import DictCursor
+        from asyncmy.errors import Error as DriverError
+        return SimpleNamespace(name='asyncmy', create_pool=asyncmy.create_pool,
+                               DictCursor=DictCursor, Error=DriverError)
+    except ImportError:
+        import aiomysql
+        return SimpleNamespace(name='aiomysql', create_pool=aiomysql.create_pool,
+                               DictCursor=aiomysql.DictCursor, Error=aiomysql.Error)
+
+
+class AsyncDatabaseManager:
+    """
+    asyncio counterpart of DatabaseManager built on asyncmy or aiomysql.
+    
+    A single event loop multiplexes many in-flight queries over pool_size
+    connections, overlapping server execution with client work instead of
+    pinning one OS thread per blocking query.
+    """
+    
+    def __init__(self, config: DatabaseConfig):
+        self.config = config
+        self.pool = None
+        self.metrics = QueryMetrics()
+        self.is_connected = False
+        self._driver = None
+        
+        # Audit context for tracking operations
+        self.audit_context = {
+            'application_name': config.application_name,
+            'environment': config.environment,
+            'version': config.version,
+            'session_id': f"python_async_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        }
+        self._audit_params = (
+            config.user,
+            self.audit_context['application_name'],
+            self.audit_context['session_id'],
+            self.audit_context['environment']
+        )
+        
+        # The async pools never reset sessions, so audit variables are set once per connection
+        self._initialized_conns = weakref.WeakSet()
+    
+    async def initialize(self) -> None:
+        """Initialize the async connection pool"""
+        # Optional dependency, only required for async callers
+        self._driver = _load_async_driver()
+        
+        ssl_context = None
+        if not self.config.ssl_disabled:
+            import ssl
+            ssl_context = ssl.create_default_context(cafile=self.config.ssl_ca)
+            if self.config.ssl_cert:
+                ssl_context.load_cert_chain(self.config.ssl_cert, self.config.ssl_key)
+        
+        try:
+            self.pool = await self._driver.create_pool(
+                minsize=max(1, self.config.pool_size // 2),
+                maxsize=self.config.pool_size,
+                host=self.config.host,
+                port=self.config.port,
+                db=self.config.database,
+                user=self.config.user,
+                password=self.config.password,
+                autocommit=self.config.autocommit,
+                charset=self.config.charset,
+                connect_timeout=self.config.connection_timeout,
+                init_command=f"SET time_zone = '{self.config.time_zone}'",
+                ssl=ssl_context
+            )
+            
+            self.is_connected = True
+            logger.info("Async database connection pool initialized (%s): %s:%s/%s", self._driver.name, self.config.host, self.config.port, self.config.database)
+        
+        except self._driver.Error as e:
+            logger.error("Failed to initialize async database pool: %s", e)
+            raise
+    
+    @asynccontextmanager
+    async def get_connection(self):
+        """
+        Async context manager for database connections with audit context setup
+        """
+        if not self.is_connected:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        
+        connection = await self.pool.acquire()
+        failed = False
+        try:
+            if connection not in self._initialized_conns:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "SET @audit_user = %s, @audit_app = %s, @audit_session = %s, @audit_env = %s",
+                        self._audit_params
+                    )
+                self._initialized_conns.add(connection)
+            
+            yield connection
+        
+        except self._driver.Error as e:
+            failed = True
+            self._initialized_conns.discard(connection)
+            await connection.rollback()
+            logger.error("Database connection error: %s", e)
+            raise
+        finally:
+            try:
+                if not failed and connection.get_transaction_status():
+                    await connection.rollback()
+            finally:
+                self.pool.release(connection)
+    
+    async def execute_query(self, sql: str, params: Optional[Tuple] = None,
+                            fetch_all: bool = True) -> Tuple[List, float]:
+        """
+        Execute SQL query with performance monitoring
+        
+        Args:
+            sql: SQL query string
+            params: Query parameters
+            fetch_all: Whether to fetch all results
+            
+        Returns:
+            Tuple of (results, execution_time)
+        """
+        start_time = time.perf_counter()
+        success = True
+        results = []
+        
+        try:
+            async with self.get_connection() as connection:
+                async with connection.cursor(self._driver.DictCursor) as cursor:
+                    await cursor.execute(sql, params or ())
+                    
+                    if cursor.description:  # SELECT query
+                        results = await cursor.fetchall() if fetch_all else await cursor.fetchone()
+                    else:  # INSERT/UPDATE/DELETE
+                        results = {
+                            'affected_rows': cursor.rowcount,
+                            'last_insert_id': cursor.lastrowid
+                        }
+        
+        except self._driver.Error as e:
+            success = False
+            logger.error("Query execution failed: %s", e)
+            logger.error("SQL: %s", sql)
+            logger.error("Params: %s", params)
+            raise
+        finally:
+            execution_time = time.perf_counter() - start_time
+            self.metrics.record_query(sql, execution_time, success)
+        
+        return results, execution_time
+    
+    async def execute_transaction(self, queries: List[Tuple[str, Optional[Tuple]]]) -> Dict[str, Any]:
+        """
+        Execute multiple queries in a transaction
+        
+        Args:
+            queries: List of (sql, params) tuples. A LAST_INSERT_ID parameter
+                refers to the id generated by the preceding INSERT.
+            
+        Returns:
+            Transaction execution summary
+        """
+        start_time = time.perf_counter()
+        results = []
+        
+        async with self.get_connection() as connection:
+            await connection.begin()
+            try:
+                async with connection.cursor(self._driver.DictCursor) as cursor:
+                    for sql, params in queries:
+                        query_start = time.perf_counter()
+                        await cursor.execute(*_splice_last_insert_id(sql, params))
+                        
+                        if cursor.description:
+                            result = await cursor.fetchall()
+                        else:
+                            result = {
+                                'affected_rows': cursor.rowcount,
+                                'last_insert_id': cursor.lastrowid
+                            }
+                        
+                        results.append({
+                            'sql': sql,
+                            'result': result,
+                            'execution_time': time.perf_counter() - query_start
+                        })
+                
+                await connection.commit()
+                logger.info("Transaction completed successfully with %s queries", len(queries))
+            
+            except self._driver.Error as e:
+                await connection.rollback()
+                logger.error("Transaction failed, rolled back: %s", e)
+                raise
+        
+        total_time = time.perf_counter() - start_time
+        return {
+            'success': True,
+            'total_execution_time': total_time,
+            'query_count': len(queries),
+            'results': results
+        }
+    
+    async def batch_insert(self, table: str, columns: List[str], rows: List[Tuple],
+                           batch_size: int = 1000, on_duplicate_update: bool = False) -> Dict[str, Any]:
+        """
+        Perform batch insert operation using multi-row INSERT statements
+        
+        Args:
+            table: Target table name
+            columns: Column names
+            rows: Row data
+            batch_size: Number of rows per batch
+            on_duplicate_update: Use ON DUPLICATE KEY UPDATE
+            
+        Returns:
+            Insert operation summary
+        """
+        if not rows:
+            raise ValueError("No data provided for batch insert")
+        
+        total_inserted = 0
+        batches_processed = 0
+        start_time = time.perf_counter()
+        column_key = tuple(columns)
+        batch_size = max(1, min(batch_size, _MAX_PLACEHOLDERS // len(columns)))
+        
+        try:
+            async with self.get_connection() as connection:
+                async with connection.cursor() as cursor:
+                    for i in range(0, len(rows), batch_size):
+                        batch = rows[i:i + batch_size]
+                        sql = _insert_statement(table, column_key, on_duplicate_update, len(batch))
+                        await cursor.execute(sql, list(itertools.chain.from_iterable(batch)))
+                        total_inserted += cursor.rowcount
+                        batches_processed += 1
+                
+                await connection.commit()
+        
+        except self._driver.Error as e:
+            logger.error("Batch insert failed for table %s: %s", table, e)
+            raise
+        
+        execution_time = time.perf_counter() - start_time
+        logger.info("Batch insert completed: %s rows in %.2fs", total_inserted, execution_time)
+        
+        return {
+            'table': table,
+            'total_rows': len(rows),
+            'inserted_rows': total_inserted,
+            'batches_processed': batches_processed,
+            'execution_time': execution_time
+        }
+    
+    async def gather(self, *queries: Tuple[str, Optional[Tuple]]) -> List[Tuple[List, float]]:
+        """
+        Run independent queries concurrently, e.g.
+        asyncio.run(manager.gather((sql1, None), (sql2, (42,))))
+        
+        Returns:
+            List of (results, execution_time) in the same order as queries
+        """
+        import asyncio
+        return await asyncio.gather(*(self.execute_query(sql, params) for sql, params in queries))
+    
+    def get_performance_stats(self) -> Dict[str, Any]:
+        """Get detailed performance statistics"""
+        return self.metrics.get_stats()
+    
+    async def close(self) -> None:
+        """Close the async connection pool"""
+        if self.pool:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+            self.is_connected = False
+            logger.info("Async database connection pool closed")
+
+
 # Configuration factory functions
 
 def create_database_manager(environment: str = 'development', 
@@ -565,12 +1891,14 @@ def create_database_manager(environment: str = 'development',
     
     Args:
         environment: Target environment (development, staging, production)
-        config_file: Optional YAML config file path
+        config_file: Optional YAML or JSON config file path
         
     Returns:
         Configured DatabaseManager instance
     """
-    if config_file:
+    if config_file and config_file.endswith('.json'):
+        config = DatabaseConfig.from_json(config_file)
+    elif config_file:
         config = DatabaseConfig.from_yaml(config_file)
     else:
         config = DatabaseConfig.from_environment(environment)
@@ -581,10 +1909,33 @@ def create_database_manager(environment: str = 'development',
     return db_manager
 
 
+async def create_async_database_manager(environment: str = 'development',
+                                        config_file: Optional[str] = None) -> AsyncDatabaseManager:
+    """
+    Factory function to create configured AsyncDatabaseManager
+    
+    Args:
+        environment: Target environment (development, staging, production)
+        config_file: Optional YAML or JSON config file path
+        
+    Returns:
+        Initialized AsyncDatabaseManager instance
+    """
+    if config_file and config_file.endswith('.json'):
+        config = DatabaseConfig.from_json(config_file)
+    elif config_file:
+        config = DatabaseConfig.from_yaml(config_file)
+    else:
+        config = DatabaseConfig.from_environment(environment)
+    
+    db_manager = AsyncDatabaseManager(config)
+    await db_manager.initialize()
+    
+    return db_manager
+
+
 # Example usage and testing
 if __name__ == "__main__":
-    import asyncio
-    
     def example_usage():
         """Example of using the DatabaseManager"""
         try:
@@ -616,7 +1967,7 @@ if __name__ == "__main__":
             print(f"Query stats: {stats}")
             
         except Exception as e:
-            logger.error(f"Example failed: {e}")
+            logger.error("Example failed: %s", e)
         finally:
             if 'db' in locals():
                 db.close()
@@ -11,74 +11,171 @@ import sys
 import os
 import json
 import argparse
+import time
+import functools
+import threading
+import concurrent.futures
 from datetime import datetime
-import mysql.connector
-from mysql.connector import Error
-import subprocess
 
-# Add project root to path
+try:
+    import orjson  # C/Rust JSON encoder, optional
+except ImportError:
+    orjson = None
+
+# Add project root to path (the manager itself is imported on first connect)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.connection.python_database_manager import create_database_manager
+
+# Severity of each check status; the overall status is the worst one seen
+STATUS_RANK = {'healthy': 0, 'not_applicable': 0, 'unknown': 0,
+               'warning': 1, 'critical': 2, 'failed': 2}
+OVERALL_STATUS = ('healthy', 'warning', 'critical')
+
+# (warning, critical) limits per metric; a value above a limit earns that status.
+# Override at runtime with --threshold key=warning,critical
+THRESHOLDS = {
+    'pool_utilization': (80, 95),      # percent of connection limit
+    'error_rate': (1.0, 5.0),          # percent of queries
+    'slow_query_rate': (10.0, 25.0),   # percent of queries
+    'replication_lag_s': (60, 300),
+    'db_size_mb': (10000, 50000),
+    'backup_age_h': (25, 48),
+}
+
+
+def _grade(value, key):
+    """Map a metric value to a status using THRESHOLDS[key]"""
+    warning, critical = THRESHOLDS[key]
+    return 'critical' if value > critical else 'warning' if value > warning else 'healthy'
+
+
+def _worse(*statuses):
+    """Return the most severe of the given statuses"""
+    return max(statuses, key=lambda status: STATUS_RANK.get(status, 0))
+
+# Results of slow-changing checks, reused across runs within one process:
+# {(environment, check_name): (expires_at, result)}
+_cache = {}
+
+
+def ttl_cache(name, seconds):
+    """
+    Reuse a check's result for `seconds` (failures are not cached)
+    
+    The decorated check returns its result instead of recording it; the
+    wrapper records it and caches that value, never a deadline placeholder.
+    """
+    def decorator(check):
+        @functools.wraps(check)
+        def wrapper(self):
+            key = (self.environment, name)
+            entry = _cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                self._record(name, entry[1])
+                return
+            
+            result = check(self)
+            if result.get('status') != 'failed':
+                _cache[key] = (time.monotonic() + seconds, result)
+            self._record(name, result)
+        return wrapper
+    return decorator
+
+
+# One manager (and pool) per environment, shared by every checker in the
+# process so repeated runs reuse connections instead of opening a new pool
+_shared_managers = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_manager(environment):
+    """Return the process-wide database manager for environment, creating it once"""
+    with _shared_lock:
+        if environment not in _shared_managers:
+            from config.connection.python_database_manager import create_database_manager
+            _shared_managers[environment] = create_database_manager(environment)
+        return _shared_managers[environment]
+
+
+def close_shared_managers():
+    """Close every shared database manager"""
+    with _shared_lock:
+        while _shared_managers:
+            _shared_managers.popitem()[1].close()
 
 
 class DatabaseHealthChecker:
     """Comprehensive database health monitoring"""
     
-    def __init__(self, environment='development'):
+    def __init__(self, environment='development', timeout_ms=2000, db_manager=None,
+                 fail_fast=False):
         self.environment = environment
-        self.db = None
+        self.timeout_ms = timeout_ms
+        self.fail_fast = fail_fast
+        self.db = db_manager  # Injected or shared; never closed by the checker
         self.health_status = {
             'overall': 'healthy',
             'timestamp': datetime.now().isoformat(),
             'environment': environment,
             'checks': {}
         }
+        # Checks run concurrently and all record into health_status;
+        # results arriving after the deadline are dropped
+        self._lock = threading.Lock()
+        self._deadline_passed = False
+        self.checks_in_flight = 0  # Checks still running when run_all_checks returned
+        self._worst = 0  # Index into OVERALL_STATUS
+    
+    def _record(self, name, result):
+        """Store one check's result and fold it into the running overall status (thread-safe)"""
+        with self._lock:
+            if not self._deadline_passed:
+                self.health_status['checks'][name] = result
+                self._worst = max(self._worst, STATUS_RANK.get(result.get('status'), 0))
     
     def connect(self):
-        """Establish database connection"""
+        """Verify the database is reachable through the existing pool"""
         try:
-            self.db = create_database_manager(self.environment)
+            if self.db is None:
+                self.db = get_shared_manager(self.environment)
+            
+            probe = self.db.health_check()
+            if probe['status'] != 'healthy':
+                raise RuntimeError(probe.get('error', 'database unhealthy'))
             return True
         except Exception as e:
-            self.health_status['overall'] = 'critical'
-            self.health_status['checks']['connection'] = {
+            self._record('connection', {
                 'status': 'failed',
                 'error': str(e)
-            }
+            })
             return False
     
     def check_connection_pool(self):
         """Check database connection pool status"""
         try:
-            pool_status = self.db.getPoolStatus()
+            pool_status = self.db.get_pool_status()
             
             # Calculate connection utilization
-            total_connections = pool_status.get('totalConnections', 0)
-            connection_limit = pool_status.get('config', {}).get('connectionLimit', 10)
+            total_connections = pool_status['in_use']
+            connection_limit = pool_status['pool_size']
             utilization = (total_connections / connection_limit) * 100 if connection_limit > 0 else 0
             
-            status = 'healthy'
-            if utilization > 80:
-                status = 'warning'
-            if utilization > 95:
-                status = 'critical'
+            status = _grade(utilization, 'pool_utilization')
             
-            self.health_status['checks']['connection_pool'] = {
+            self._record('connection_pool', {
                 'status': status,
                 'total_connections': total_connections,
+                'idle_connections': pool_status['idle'],
                 'connection_limit': connection_limit,
                 'utilization_percent': round(utilization, 2),
-                'queued_requests': pool_status.get('queuedRequests', 0)
-            }
+                'pool_exhaustions': pool_status['pool_exhaustions']
+            })
             
         except Exception as e:
-            self.health_status['checks']['connection_pool'] = {
+            self._record('connection_pool', {
                 'status': 'failed',
                 'error': str(e)
-            }
-            if self.health_status['overall'] == 'healthy':
-                self.health_status['overall'] = 'warning'
+            })
     
     def check_query_performance(self):
         """Check query performance metrics"""
@@ -86,33 +183,26 @@ class DatabaseHealthChecker:
             stats = self.db.get_performance_stats()
             
             # Determine status based on performance metrics
-            status = 'healthy'
-            if stats['error_rate'] > 1.0:  # > 1% error rate
-                status = 'warning'
-            if stats['error_rate'] > 5.0:  # > 5% error rate
-                status = 'critical'
-            
-            if stats['slow_query_rate'] > 10.0:  # > 10% slow queries
-                status = 'warning'
-            if stats['slow_query_rate'] > 25.0:  # > 25% slow queries
-                status = 'critical'
+            status = _worse(_grade(stats['error_rate'], 'error_rate'),
+                            _grade(stats['slow_query_rate'], 'slow_query_rate'))
             
-            self.health_status['checks']['query_performance'] = {
+            self._record('query_performance', {
                 'status': status,
                 'total_queries': stats['total_queries'],
                 'error_rate': stats['error_rate'],
                 'slow_query_rate': stats['slow_query_rate'],
                 'average_execution_time': stats['average_execution_time']
-            }
+            })
             
         except Exception as e:
-            self.health_status['checks']['query_performance'] = {
+            self._record('query_performance', {
                 'status': 'failed',
                 'error': str(e)
-            }
+            })
     
+    @ttl_cache('database_size', seconds=300)
     def check_database_size(self):
-        """Check database and table sizes"""
+        """Check database and table sizes (returned; ttl_cache records it)"""
         try:
             query = """
             SELECT 
@@ -121,28 +211,27 @@ class DatabaseHealthChecker:
                 COUNT(*) as table_count
             FROM information_schema.tables 
             WHERE table_schema NOT IN ('information_schema', 'mysql', 'performance_schema', 'sys')
-            GROUP BY table_schema
+            GROUP BY table_schema WITH ROLLUP
             """
             
-            results, _ = self.db.execute_query(query)
+            # Fixed statements: prepared once per pooled connection, then re-executed
+            results, _ = self.db.execute_query(query, row_factory='dict', prepared=True)
             
-            total_size = sum(row['total_size_mb'] for row in results)
+            # The server appends the grand total as a final row with a NULL schema
+            total_size = 0
+            if results and results[-1]['database_name'] is None:
+                total_size = results.pop()['total_size_mb']
             
-            # Simple size check (adjust thresholds as needed)
-            status = 'healthy'
-            if total_size > 10000:  # > 10GB
-                status = 'warning'
-            if total_size > 50000:  # > 50GB
-                status = 'critical'
+            status = _grade(total_size, 'db_size_mb')
             
-            self.health_status['checks']['database_size'] = {
+            return {
                 'status': status,
                 'total_size_mb': total_size,
                 'databases': results
             }
             
         except Exception as e:
-            self.health_status['checks']['database_size'] = {
+            return {
                 'status': 'failed',
                 'error': str(e)
             }
@@ -152,7 +241,7 @@ class DatabaseHealthChecker:
         try:
             # Check if this is a replica
             show_slave_query = "SHOW SLAVE STATUS"
-            results, _ = self.db.execute_query(show_slave_query)
+            results, _ = self.db.execute_query(show_slave_query, row_factory='dict')
             
             if results:
                 # This is a replica, check lag
@@ -161,48 +250,49 @@ class DatabaseHealthChecker:
                 
                 if seconds_behind_master is None:
                     status = 'critical'  # Replication broken
-                elif seconds_behind_master > 300:  # > 5 minutes
-                    status = 'critical'
-                elif seconds_behind_master > 60:   # > 1 minute
-                    status = 'warning'
                 else:
-                    status = 'healthy'
+                    status = _grade(seconds_behind_master, 'replication_lag_s')
                 
-                self.health_status['checks']['replication'] = {
+                self._record('replication', {
                     'status': status,
                     'seconds_behind_master': seconds_behind_master,
                     'slave_io_running': slave_status.get('Slave_IO_Running'),
                     'slave_sql_running': slave_status.get('Slave_SQL_Running')
-                }
+                })
             else:
                 # Not a replica
-                self.health_status['checks']['replication'] = {
+                self._record('replication', {
                     'status': 'not_applicable',
                     'message': 'This server is not configured as a replica'
-                }
+                })
                 
         except Exception as e:
             # Might not have replication permissions
-            self.health_status['checks']['replication'] = {
+            self._record('replication', {
                 'status': 'unknown',
                 'error': str(e)
-            }
+            })
     
     def check_audit_log_health(self):
         """Check audit log table health"""
         try:
-            # Check audit log growth
+            # Check audit log growth. Only the last day is counted, as a range
+            # scan on idx_changed_at; MIN/MAX resolve from the index ends and
+            # the total is the optimizer's row estimate, so the probe does not
+            # grow with the table.
             query = """
             SELECT 
-                COUNT(*) as total_records,
+                COUNT(*) as last_day,
                 COUNT(CASE WHEN changed_at >= DATE_SUB(NOW(), INTERVAL 1 HOUR) THEN 1 END) as last_hour,
-                COUNT(CASE WHEN changed_at >= DATE_SUB(NOW(), INTERVAL 1 DAY) THEN 1 END) as last_day,
-                MIN(changed_at) as oldest_record,
-                MAX(changed_at) as newest_record
-            FROM audit_log
+                (SELECT MIN(changed_at) FROM audit_log) as oldest_record,
+                (SELECT MAX(changed_at) FROM audit_log) as newest_record,
+                (SELECT table_rows FROM information_schema.tables
+                 WHERE table_schema = DATABASE() AND table_name = 'audit_log') as total_records
+            FROM audit_log USE INDEX (idx_changed_at)
+            WHERE changed_at >= DATE_SUB(NOW(), INTERVAL 1 DAY)
             """
             
-            results, _ = self.db.execute_query(query)
+            results, _ = self.db.execute_query(query, row_factory='dict', prepared=True)
             audit_stats = results[0] if results else {}
             
             # Check if audit log is growing (should have recent entries)
@@ -212,124 +302,167 @@ class DatabaseHealthChecker:
             if last_hour_count == 0:
                 status = 'warning'  # No recent audit entries
             
-            self.health_status['checks']['audit_log'] = {
+            self._record('audit_log', {
                 'status': status,
-                'total_records': audit_stats.get('total_records', 0),
+                'total_records': audit_stats.get('total_records', 0),  # Approximate
                 'last_hour_records': last_hour_count,
                 'last_day_records': audit_stats.get('last_day', 0),
                 'oldest_record': str(audit_stats.get('oldest_record', '')),
                 'newest_record': str(audit_stats.get('newest_record', ''))
-            }
+            })
             
         except Exception as e:
-            self.health_status['checks']['audit_log'] = {
+            self._record('audit_log', {
                 'status': 'failed',
                 'error': str(e)
-            }
+            })
     
+    @ttl_cache('backup', seconds=60)
     def check_backup_status(self):
-        """Check recent backup status"""
+        """Check recent backup status (returned; ttl_cache records it)"""
         try:
             # Look for recent backup files
             backup_dir = "/var/backups/mysql"  # Default backup directory
             
             if os.path.exists(backup_dir):
-                # Find most recent backup
-                backup_files = []
-                for file in os.listdir(backup_dir):
-                    if file.endswith(('.sql', '.sql.gz')):
-                        file_path = os.path.join(backup_dir, file)
-                        stat = os.stat(file_path)
-                        backup_files.append({
-                            'filename': file,
-                            'size_mb': round(stat.st_size / 1024 / 1024, 2),
-                            'modified': datetime.fromtimestamp(stat.st_mtime)
-                        })
+                # Find most recent backup in a single pass over the directory
+                latest_name = None
+                latest_stat = None
+                total_backups = 0
+                with os.scandir(backup_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(('.sql', '.sql.gz')):
+                            continue
+                        total_backups += 1
+                        stat = entry.stat()
+                        if latest_stat is None or stat.st_mtime > latest_stat.st_mtime:
+                            latest_name, latest_stat = entry.name, stat
                 
-                if backup_files:
-                    # Sort by modification time, most recent first
-                    backup_files.sort(key=lambda x: x['modified'], reverse=True)
-                    latest_backup = backup_files[0]
-                    
+                if latest_stat is not None:
                     # Check if backup is recent (within last 24 hours)
-                    hours_since_backup = (datetime.now() - latest_backup['modified']).total_seconds() / 3600
-                    
-                    status = 'healthy'
-                    if hours_since_backup > 48:  # > 48 hours
-                        status = 'critical'
-                    elif hours_since_backup > 25:  # > 25 hours
-                        status = 'warning'
+                    hours_since_backup = (time.time() - latest_stat.st_mtime) / 3600
+                    status = _grade(hours_since_backup, 'backup_age_h')
                     
-                    self.health_status['checks']['backup'] = {
+                    return {
                         'status': status,
-                        'latest_backup': latest_backup['filename'],
+                        'latest_backup': latest_name,
                         'hours_since_backup': round(hours_since_backup, 1),
-                        'backup_size_mb': latest_backup['size_mb'],
-                        'total_backups': len(backup_files)
+                        'backup_size_mb': round(latest_stat.st_size / 1024 / 1024, 2),
+                        'total_backups': total_backups
                     }
                 else:
-                    self.health_status['checks']['backup'] = {
+                    return {
                         'status': 'critical',
                         'message': 'No backup files found'
                     }
             else:
-                self.health_status['checks']['backup'] = {
+                return {
                     'status': 'warning',
                     'message': f'Backup directory not found: {backup_dir}'
                 }
                 
         except Exception as e:
-            self.health_status['checks']['backup'] = {
+            return {
                 'status': 'failed',
                 'error': str(e)
             }
     
-    def determine_overall_status(self):
-        """Determine overall health status based on individual checks"""
-        has_critical = False
-        has_warning = False
+    def _start_check(self, name, check):
+        """
+        Run check on a daemon thread and return a Future for it
         
-        for check_name, check_result in self.health_status['checks'].items():
-            status = check_result.get('status', 'unknown')
-            
-            if status == 'critical' or status == 'failed':
-                has_critical = True
-            elif status == 'warning':
-                has_warning = True
+        Unlike executor workers, daemon threads are not joined at
+        interpreter exit, so a check stuck past the deadline cannot keep
+        the process alive.
+        """
+        future = concurrent.futures.Future()
         
-        if has_critical:
-            self.health_status['overall'] = 'critical'
-        elif has_warning:
-            self.health_status['overall'] = 'warning'
-        else:
-            self.health_status['overall'] = 'healthy'
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(check())
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, name=f"health_{name}", daemon=True).start()
+        return future
     
     def run_all_checks(self):
         """Run all health checks"""
         if not self.connect():
+            self.health_status['overall'] = OVERALL_STATUS[self._worst]
             return self.health_status
         
         try:
+            # Read pool usage before the other checks start, so their own
+            # checked-out connections don't show up as utilization
             self.check_connection_pool()
-            self.check_query_performance()
-            self.check_database_size()
-            self.check_replication_lag()
-            self.check_audit_log_health()
-            self.check_backup_status()
             
-            self.determine_overall_status()
+            # The remaining checks are independent and I/O-bound, so running
+            # them concurrently bounds the total time by the slowest one
+            checks = {
+                'query_performance': self.check_query_performance,
+                'database_size': self.check_database_size,
+                'replication': self.check_replication_lag,
+                'audit_log': self.check_audit_log_health,
+                'backup': self.check_backup_status
+            }
+            futures = {self._start_check(name, check): name for name, check in checks.items()}
+            
+            # Every check starts at once, so one deadline bounds each of them;
+            # a stuck check is reported instead of stalling the whole run.
+            # With fail_fast, stop waiting as soon as the run is already critical
+            deadline = time.monotonic() + self.timeout_ms / 1000
+            return_when = (concurrent.futures.FIRST_COMPLETED if self.fail_fast
+                           else concurrent.futures.ALL_COMPLETED)
+            done, pending = set(), set(futures)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or (self.fail_fast and self._worst == 2):
+                    break
+                finished, pending = concurrent.futures.wait(pending, timeout=remaining,
+                                                            return_when=return_when)
+                done |= finished
+            
+            with self._lock:
+                self._deadline_passed = True
+                for future in pending:
+                    future.cancel()
+                    if futures[future] in self.health_status['checks']:
+                        continue  # Recorded just as the wait ended
+                    if self._worst == 2 and self.fail_fast:
+                        result = {'status': 'unknown', 'message': 'skipped (fail-fast)'}
+                    else:
+                        result = {'status': 'warning',
+                                  'error': f'check exceeded {self.timeout_ms}ms'}
+                        self._worst = max(self._worst, 1)
+                    self.health_status['checks'][futures[future]] = result
+            self.checks_in_flight = sum(1 for future in pending if not future.done())
+            for future in done:
+                future.result()
             
         except Exception as e:
-            self.health_status['overall'] = 'critical'
+            self._worst = 2
             self.health_status['error'] = str(e)
         
-        finally:
-            if self.db:
-                self.db.close()
-        
+        self.health_status['overall'] = OVERALL_STATUS[self._worst]
         return self.health_status
 
 
+def parse_threshold(spec):
+    """Parse a --threshold value of the form key=warning,critical"""
+    key, sep, limits = spec.partition('=')
+    if not sep or key not in THRESHOLDS:
+        raise argparse.ArgumentTypeError(
+            f"expected key=warning,critical with key in {', '.join(THRESHOLDS)}")
+    try:
+        warning, critical = (float(limit) for limit in limits.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid limits for {key}: {limits!r}")
+    return key, (warning, critical)
+
+
 def main():
     """Main execution function"""
     parser = argparse.ArgumentParser(description='MySQL Database Health Checker')
@@ -340,16 +473,34 @@ def main():
                       help='Output format')
     parser.add_argument('--quiet', '-q', action='store_true',
                       help='Only output errors and warnings')
+    parser.add_argument('--timeout-ms', type=int, default=2000,
+                      help='Deadline for each check in milliseconds')
+    parser.add_argument('--fail-fast', action='store_true',
+                      help='Stop waiting for remaining checks once one is critical')
+    parser.add_argument('--threshold', type=parse_threshold, action='append', default=[],
+                      metavar='KEY=WARN,CRIT',
+                      help='Override a status threshold (repeatable)')
     
     args = parser.parse_args()
+    THRESHOLDS.update(args.threshold)
     
     # Run health checks
-    checker = DatabaseHealthChecker(args.environment)
+    checker = DatabaseHealthChecker(args.environment, timeout_ms=args.timeout_ms,
+                                    fail_fast=args.fail_fast)
     health_status = checker.run_all_checks()
+    if not checker.checks_in_flight:
+        # A check still running may hold a pooled connection; the process
+        # exit drops those connections instead
+        close_shared_managers()
     
     # Output results
     if args.output == 'json':
-        print(json.dumps(health_status, indent=2, default=str))
+        if orjson is not None:
+            # Decimal and other non-native values fall back to str, as with json
+            sys.stdout.buffer.write(orjson.dumps(health_status, option=orjson.OPT_INDENT_2, default=str) + b'\n')
+            sys.stdout.flush()
+        else:
+            print(json.dumps(health_status, indent=2, default=str))
     else:
         # Text output
         print(f"Database Health Check - {args.environment.upper()}")
@@ -12,14 +12,87 @@ import os
 import logging
 import mysql.connector
 from mysql.connector import Error, pooling
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import json
 import yaml
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Union
 import configparser
 from contextlib import contextmanager
 import time
+import threading
+import weakref
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow  # noqa: F401  Arrow-backed string columns, optional
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = 'string'
+
+# Extracted columns stored as categoricals (low cardinality) or as
+# contiguous strings (high cardinality) instead of boxed Python objects
+CATEGORY_COLUMNS = ['order_status']
+STRING_COLUMNS = ['customer_email', 'customer_name']
+
+# Output names for the flattened per-customer order aggregates
+ORDER_SUMMARY_COLUMNS = {
+    'order_id_count': 'total_orders',
+    'total_amount_sum': 'total_spent',
+    'total_amount_count': 'valued_orders',
+    'total_amount_min': 'min_order_value',
+    'total_amount_max': 'max_order_value',
+    'created_at_min': 'first_order_date',
+    'created_at_max': 'last_order_date',
+}
+
+# Daily sales aggregates for [start, end), one row per day
+DAILY_SALES_QUERY = """
+            SELECT 
+                DATE(o.created_at) as order_date,
+                COUNT(DISTINCT o.order_id) as total_orders,
+                SUM(o.total_amount) as total_order_value,
+                AVG(o.total_amount) as avg_order_value,
+                COUNT(DISTINCT o.customer_id) as total_customers,
+                COUNT(DISTINCT CASE 
+                    WHEN c.created_at >= DATE(o.created_at) - INTERVAL 1 DAY 
+                    THEN o.customer_id 
+                END) as new_customers,
+                DAYNAME(o.created_at) as day_of_week,
+                CASE WHEN DAYOFWEEK(o.created_at) IN (1, 7) THEN 1 ELSE 0 END as is_weekend
+            FROM orders o
+            JOIN customers c ON o.customer_id = c.customer_id
+            WHERE o.created_at >= %s AND o.created_at < %s
+                AND o.order_status NOT IN ('cancelled')
+            GROUP BY DATE(o.created_at)
+            """
+
+# The same aggregates upserted by the server itself, for when the source
+# tables live in the target database
+DAILY_SALES_UPSERT = f"""
+            INSERT INTO daily_sales_summary (
+                summary_date, total_orders, total_order_value, avg_order_value,
+                total_customers, new_customers, returning_customers,
+                day_of_week, is_weekend
+            )
+            SELECT 
+                d.order_date, d.total_orders, d.total_order_value, d.avg_order_value,
+                d.total_customers, d.new_customers, d.total_customers - d.new_customers,
+                d.day_of_week, d.is_weekend
+            FROM ({DAILY_SALES_QUERY}) d
+            ON DUPLICATE KEY UPDATE
+                total_orders = VALUES(total_orders),
+                total_order_value = VALUES(total_order_value),
+                avg_order_value = VALUES(avg_order_value),
+                total_customers = VALUES(total_customers),
+                new_customers = VALUES(new_customers),
+                returning_customers = VALUES(returning_customers),
+                day_of_week = VALUES(day_of_week),
+                is_weekend = VALUES(is_weekend)
+            """
 
 # Configure logging
 logging.basicConfig(
@@ -54,6 +127,17 @@ class MySQLETLPipeline:
         """
         self.config = self._load_config(config_file)
         self.connection_pool = None
+        # Target table columns and generated INSERT statements, built once per process
+        self._schema_cache: Dict[str, List[str]] = {}
+        self._insert_cache: Dict[tuple, str] = {}
+        # Prepared extract cursors per session: {connection_id: {query: cursor}},
+        # least recently used session first. Pooled sessions are not reset,
+        # so their server-side statements stay valid
+        self._prepared_cursors: OrderedDict = OrderedDict()
+        self._prepared_lock = threading.Lock()
+        # Server session id each physical connection last set the audit
+        # variables in; a reconnect gets a new id and sets them again
+        self._audited_sessions = weakref.WeakKeyDictionary()
         self.audit_context = {
             'user': 'etl_system',
             'application': 'ETL_Pipeline',
@@ -96,17 +180,25 @@ class MySQLETLPipeline:
     def initialize_connections(self):
         """Initialize database connection pools"""
         try:
-            # Source database pool
+            # Source database pool. Sessions are not reset on return:
+            # get_connection ends any open transaction itself, and sets the
+            # audit variables once per server session.
+            # Extracts only read, so the source runs in autocommit mode and a
+            # SELECT leaves no transaction behind to roll back
             source_config = {
                 'pool_name': 'source_pool',
                 'pool_size': self.config['source_database']['pool_size'],
-                'pool_reset_session': True,
+                'pool_reset_session': False,
                 'host': self.config['source_database']['host'],
                 'port': self.config['source_database']['port'],
                 'database': self.config['source_database']['database'],
                 'user': self.config['source_database']['user'],
                 'password': self.config['source_database']['password'],
-                'autocommit': False,
+                'autocommit': True,
+                # The C extension parses rows without holding the GIL, so
+                # the concurrent ETLs overlap; fall back to pure Python
+                # when it is not built
+                'use_pure': not getattr(mysql.connector, 'HAVE_CEXT', False),
                 'charset': 'utf8mb4',
                 'collation': 'utf8mb4_unicode_ci'
             }
@@ -122,7 +214,8 @@ class MySQLETLPipeline:
                 'port': self.config['target_database']['port'],
                 'database': self.config['target_database']['database'],
                 'user': self.config['target_database']['user'],
-                'password': self.config['target_database']['password']
+                'password': self.config['target_database']['password'],
+                'autocommit': False  # Loads commit explicitly in load_data
             })
             
             self.target_pool = pooling.MySQLConnectionPool(**target_config)
@@ -148,12 +241,18 @@ class MySQLETLPipeline:
             else:
                 connection = self.target_pool.get_connection()
             
-            # Set audit context variables
-            cursor = connection.cursor()
-            cursor.execute("SET @audit_user = %s", (self.audit_context['user'],))
-            cursor.execute("SET @audit_app = %s", (self.audit_context['application'],))
-            cursor.execute("SET @audit_session = %s", (self.audit_context['session_id'],))
-            cursor.close()
+            # Bound as parameters, so the values need no escaping whatever
+            # the server's sql_mode
+            raw_connection = getattr(connection, '_cnx', connection)
+            if self._audited_sessions.get(raw_connection) != connection.connection_id:
+                cursor = connection.cursor()
+                cursor.execute(
+                    "SET @audit_user = %s, @audit_app = %s, @audit_session = %s",
+                    (self.audit_context['user'], self.audit_context['application'],
+                     self.audit_context['session_id'])
+                )
+                cursor.close()
+                self._audited_sessions[raw_connection] = connection.connection_id
             
             yield connection
             
@@ -164,22 +263,64 @@ class MySQLETLPipeline:
             raise
         finally:
             if connection:
+                # Never hand a connection back mid-transaction: without a
+                # session reset, an open snapshot would outlive this checkout
+                if connection.in_transaction:
+                    connection.rollback()
                 connection.close()
     
-    def extract_data(self, query: str, params: tuple = None) -> pd.DataFrame:
+    def _prepared_cursor(self, connection, query: str):
+        """
+        Return a prepared cursor for query on this connection, preparing it
+        on first use; later executions only bind parameters
+        """
+        session = connection.connection_id
+        with self._prepared_lock:
+            statements = self._prepared_cursors.get(session)
+            if statements is None:
+                statements = self._prepared_cursors[session] = {}
+                # A pooled connection that reconnects gets a new id, so
+                # sessions beyond the pool size are dead; drop the least
+                # recently used (their statements went with the session)
+                while len(self._prepared_cursors) > self.config['source_database']['pool_size']:
+                    self._prepared_cursors.popitem(last=False)
+            else:
+                self._prepared_cursors.move_to_end(session)
+        
+        # Only the thread holding this connection touches its statements
+        cursor = statements.get(query)
+        if cursor is None:
+            cursor = statements[query] = connection.cursor(prepared=True)
+        return cursor
+    
+    def extract_data(self, query: str, params: tuple = None,
+                     prepared: bool = False) -> pd.DataFrame:
         """
         Extract data using SQL query
         
+        Where a query's output needs row-level cleanup, doing it in the
+        query (as the customer summary extract does for names and emails)
+        lets MySQL apply it set-wise and sends fewer bytes over the wire.
+        
         Args:
             query: SQL query to execute
             params: Query parameters
+            prepared: Run as a server-side prepared statement, parsed once
+                per connection (for queries executed repeatedly)
             
         Returns:
             DataFrame with extracted data
         """
         try:
             with self.get_connection('source') as connection:
-                df = pd.read_sql(query, connection, params=params)
+                if prepared:
+                    cursor = self._prepared_cursor(connection, query)
+                    cursor.execute(query, params or ())
+                    columns = [desc[0] for desc in cursor.description]
+                    df = pd.DataFrame(cursor.fetchall(), columns=columns)
+                else:
+                    df = pd.read_sql(query, connection, params=params)
+                df = self._optimize_dtypes(df)
                 logger.info(f"Extracted {len(df)} rows from source database")
                 return df
                 
@@ -187,6 +328,81 @@ class MySQLETLPipeline:
             logger.error(f"Error extracting data: {e}")
             raise
     
+    def extract_data_chunked(self, query: str, params: tuple = None,
+                             chunksize: int = None,
+                             prepared: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Extract data using SQL query, yielding it in chunks
+        
+        The source connection is held until the iterator is exhausted or
+        closed, so consume the chunks promptly.
+        
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            chunksize: Rows per chunk (defaults to the configured batch_size)
+            prepared: Run as a server-side prepared statement (see extract_data)
+            
+        Yields:
+            DataFrames of at most chunksize rows
+        """
+        if chunksize is None:
+            chunksize = self.config.get('batch_size', 1000)
+        
+        try:
+            with self.get_connection('source') as connection:
+                # Rows are read off an unbuffered cursor as they arrive, not
+                # collected in the driver's client buffer first
+                if prepared:
+                    cursor = self._prepared_cursor(connection, query)
+                else:
+                    cursor = connection.cursor(buffered=False)
+                cursor.execute(query, params or ())
+                
+                total_rows = 0
+                try:
+                    for chunk in self._read_sql_stream(cursor, chunksize):
+                        total_rows += len(chunk)
+                        yield self._optimize_dtypes(chunk)
+                finally:
+                    if not prepared:
+                        cursor.close()
+                logger.info(f"Extracted {total_rows} rows from source database")
+        
+        except Exception as e:
+            logger.error(f"Error extracting data: {e}")
+            raise
+    
+    def _read_sql_stream(self, cursor, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Yield an executed cursor's result as DataFrames of up to chunksize rows
+        
+        If the consumer stops early the remaining rows are discarded, so the
+        connection can run its next statement.
+        """
+        columns = [desc[0] for desc in cursor.description]
+        exhausted = False
+        try:
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    exhausted = True
+                    return
+                yield pd.DataFrame(rows, columns=columns)
+        finally:
+            if not exhausted:
+                cursor.fetchall()
+    
+    def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert known string columns of an extract to compact dtypes"""
+        categories = [col for col in CATEGORY_COLUMNS if col in df.columns]
+        strings = [col for col in STRING_COLUMNS if col in df.columns]
+        if categories:
+            df[categories] = df[categories].astype('category')
+        if strings:
+            df[strings] = df[strings].astype(STRING_DTYPE)
+        return df
+    
     def transform_customer_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Transform customer data for reporting
@@ -198,17 +414,19 @@ class MySQLETLPipeline:
             Transformed DataFrame
         """
         try:
-            # Create full name
-            df['customer_name'] = df['first_name'] + ' ' + df['last_name']
+            now_ts = pd.Timestamp.now()
+            
+            # Create full name in one pass, without intermediate Series
+            df['customer_name'] = df['first_name'].str.cat(df['last_name'], sep=' ', na_rep='')
             
-            # Calculate customer age if date_of_birth exists
+            # Calculate customer age if date_of_birth exists (missing dates stay NA)
             if 'date_of_birth' in df.columns:
-                df['age'] = df['date_of_birth'].apply(
-                    lambda x: (datetime.now().date() - x).days // 365 if pd.notna(x) else None
-                )
+                today = now_ts.normalize()
+                dob = pd.to_datetime(df['date_of_birth'], errors='coerce')
+                df['age'] = ((today - dob).dt.days // 365).astype('Int64')
             
-            # Add processing metadata
-            df['processed_at'] = datetime.now()
+            # Add processing metadata (one timestamp broadcast as datetime64)
+            df['processed_at'] = now_ts
             df['etl_batch_id'] = self.audit_context['session_id']
             
             # Clean data
@@ -222,56 +440,97 @@ class MySQLETLPipeline:
             logger.error(f"Error transforming customer data: {e}")
             raise
     
-    def transform_order_summary(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _partial_order_summary(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Per-customer aggregates for one chunk of order rows, keyed by customer_id
+        
+        Averages are kept as a sum and a count so partial results from
+        several chunks can be combined exactly.
+        """
+        # The driver returns DECIMAL amounts as Decimal objects, and a chunk
+        # of order-less customers has only NULLs; aggregate them as floats
+        df = df.assign(total_amount=df['total_amount'].astype('float64'))
+        
+        # customer_id determines email and name, so grouping on it alone
+        # avoids hashing the string columns; they are re-attached afterwards
+        partial = df.groupby('customer_id', sort=False).agg({
+            'order_id': 'count',
+            'total_amount': ['sum', 'count', 'min', 'max'],
+            'created_at': ['min', 'max']
+        })
+        
+        # Flatten (column, aggregate) pairs to column_aggregate, then name them
+        partial.columns = ['_'.join(filter(None, map(str, col)))
+                           for col in partial.columns.to_flat_index()]
+        return partial.rename(columns=ORDER_SUMMARY_COLUMNS)
+    
+    def transform_order_summary(self, df: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> pd.DataFrame:
         """
         Transform order data for customer summary
         
         Args:
-            df: Raw order data with customer information
+            df: Raw order data with customer information, either as one
+                DataFrame or as an iterable of chunks
             
         Returns:
             Transformed customer order summary
         """
         try:
-            # Group by customer and calculate aggregates
-            summary = df.groupby(['customer_id', 'customer_email', 'customer_name']).agg({
-                'order_id': 'count',
-                'total_amount': ['sum', 'mean', 'min', 'max'],
-                'created_at': ['min', 'max']
-            }).reset_index()
-            
-            # Flatten column names
-            summary.columns = [
-                'customer_id', 'customer_email', 'customer_name',
-                'total_orders', 'total_spent', 'avg_order_value',
-                'min_order_value', 'max_order_value',
-                'first_order_date', 'last_order_date'
-            ]
-            
-            # Calculate days since last order
+            # Group by customer and calculate aggregates, chunk by chunk
+            chunks = [df] if isinstance(df, pd.DataFrame) else df
+            partials, customers = [], []
+            for chunk in chunks:
+                partials.append(self._partial_order_summary(chunk))
+                customers.append(chunk[['customer_id', 'customer_email', 'customer_name']]
+                                 .drop_duplicates('customer_id'))
+            if not partials:
+                return pd.DataFrame()
+            
+            summary = partials[0]
+            if len(partials) > 1:
+                # A customer's orders may span chunks; merge their partials
+                summary = pd.concat(partials).groupby(level=0, sort=False).agg({
+                    'total_orders': 'sum',
+                    'total_spent': 'sum',
+                    'valued_orders': 'sum',
+                    'min_order_value': 'min',
+                    'max_order_value': 'max',
+                    'first_order_date': 'min',
+                    'last_order_date': 'max'
+                })
+            
+            # NaN, not a division error, for customers without valued orders
+            valued_orders = summary['valued_orders']
+            summary.insert(2, 'avg_order_value',
+                           summary['total_spent'].div(valued_orders.where(valued_orders > 0)))
+            summary = summary.drop(columns='valued_orders').reset_index()
+            
+            customers = pd.concat(customers).drop_duplicates('customer_id')
+            summary = customers.merge(summary, on='customer_id')
+            
+            # Calculate days since last order (NA for customers without orders)
+            now_ts = pd.Timestamp.now()
+            summary['last_order_date'] = pd.to_datetime(summary['last_order_date'])
             summary['days_since_last_order'] = (
-                datetime.now() - summary['last_order_date']
-            ).dt.days
-            
-            # Classify customer segments
-            def classify_segment(row):
-                if row['total_orders'] == 0:
-                    return 'new'
-                elif row['days_since_last_order'] > 365:
-                    return 'churned'
-                elif row['days_since_last_order'] > 180:
-                    return 'at_risk'
-                elif row['total_spent'] > 5000 or row['total_orders'] > 20:
-                    return 'vip'
-                elif row['total_orders'] > 1:
-                    return 'regular'
-                else:
-                    return 'new'
-            
-            summary['customer_segment'] = summary.apply(classify_segment, axis=1)
+                now_ts - summary['last_order_date']
+            ).dt.days.astype('Int32')
+            
+            # Classify customer segments; the first matching condition wins.
+            # Customers without orders have no last order date, so every
+            # condition is false for them and they fall through to 'new'
+            days_since = summary['days_since_last_order'].to_numpy('float64', na_value=np.nan)
+            segments = {
+                'churned': days_since > 365,
+                'at_risk': days_since > 180,
+                'vip': (summary['total_spent'] > 5000) | (summary['total_orders'] > 20),
+                'regular': summary['total_orders'] > 1,
+            }
+            summary['customer_segment'] = np.select(
+                list(segments.values()), list(segments.keys()), default='new'
+            )
             
-            # Add metadata
-            summary['last_calculated_at'] = datetime.now()
+            # Add metadata (one timestamp broadcast as datetime64)
+            summary['last_calculated_at'] = now_ts
             
             logger.info(f"Created order summary for {len(summary)} customers")
             return summary
@@ -300,17 +559,15 @@ class MySQLETLPipeline:
                 if load_method == 'replace':
                     # Truncate and insert
                     cursor.execute(f"TRUNCATE TABLE {table_name}")
-                    df.to_sql(table_name, connection, if_exists='append', 
-                             index=False, method='multi')
+                    self._bulk_insert(df, table_name, connection)
                     
                 elif load_method == 'append':
                     # Simple append
-                    df.to_sql(table_name, connection, if_exists='append', 
-                             index=False, method='multi')
+                    self._bulk_insert(df, table_name, connection)
                     
                 elif load_method == 'upsert':
                     # Insert with ON DUPLICATE KEY UPDATE
-                    self._upsert_data(df, table_name, connection)
+                    self._bulk_insert(df, table_name, connection, upsert=True)
                 
                 connection.commit()
                 logger.info(f"Loaded {len(df)} rows to {table_name} using {load_method} method")
@@ -320,37 +577,54 @@ class MySQLETLPipeline:
             logger.error(f"Error loading data to {table_name}: {e}")
             raise
     
-    def _upsert_data(self, df: pd.DataFrame, table_name: str, connection):
+    def _bulk_insert(self, df: pd.DataFrame, table_name: str, connection,
+                     upsert: bool = False):
         """
-        Perform upsert operation using INSERT ... ON DUPLICATE KEY UPDATE
+        Insert rows with one statement executed per batch, optionally as an
+        upsert using INSERT ... ON DUPLICATE KEY UPDATE
         """
         cursor = connection.cursor()
         
         # Get table columns
-        cursor.execute(f"DESCRIBE {table_name}")
-        columns = [row[0] for row in cursor.fetchall()]
+        if table_name not in self._schema_cache:
+            cursor.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = DATABASE() AND table_name = %s "
+                "ORDER BY ordinal_position",
+                (table_name,)
+            )
+            self._schema_cache[table_name] = [row[0] for row in cursor.fetchall()]
+        columns = self._schema_cache[table_name]
         
         # Filter DataFrame columns to match table
         df_columns = [col for col in df.columns if col in columns]
-        df_filtered = df[df_columns]
-        
-        # Create INSERT statement with ON DUPLICATE KEY UPDATE
-        placeholders = ', '.join(['%s'] * len(df_columns))
-        columns_str = ', '.join(df_columns)
+        # The connector sends None as NULL but rejects pd.NA and NaT
+        df_filtered = df[df_columns].astype(object)
+        df_filtered = df_filtered.where(df_filtered.notna(), None)
         
-        update_clause = ', '.join([f"{col} = VALUES({col})" for col in df_columns])
-        
-        query = f"""
-        INSERT INTO {table_name} ({columns_str})
-        VALUES ({placeholders})
-        ON DUPLICATE KEY UPDATE {update_clause}
-        """
+        # Create INSERT statement, with ON DUPLICATE KEY UPDATE for upserts
+        cache_key = (table_name, tuple(df_columns), upsert)
+        query = self._insert_cache.get(cache_key)
+        if query is None:
+            placeholders = ', '.join(['%s'] * len(df_columns))
+            columns_str = ', '.join(df_columns)
+            
+            query = f"""
+            INSERT INTO {table_name} ({columns_str})
+            VALUES ({placeholders})
+            """
+            if upsert:
+                update_clause = ', '.join([f"{col} = VALUES({col})" for col in df_columns])
+                query += f"ON DUPLICATE KEY UPDATE {update_clause}\n"
+            self._insert_cache[cache_key] = query
         
-        # Execute batch insert
+        # Execute batch insert, slicing one row iterator instead of the frame
         batch_size = self.config.get('batch_size', 1000)
-        for i in range(0, len(df_filtered), batch_size):
-            batch = df_filtered.iloc[i:i+batch_size]
-            data = [tuple(row) for row in batch.to_numpy()]
+        rows = df_filtered.itertuples(index=False, name=None)
+        while True:
+            data = list(islice(rows, batch_size))
+            if not data:
+                break
             cursor.executemany(query, data)
             
         cursor.close()
@@ -366,8 +640,8 @@ class MySQLETLPipeline:
             extract_query = """
             SELECT 
                 c.customer_id,
-                c.email as customer_email,
-                CONCAT(c.first_name, ' ', c.last_name) as customer_name,
+                LOWER(c.email) as customer_email,
+                CONCAT_WS(' ', c.first_name, c.last_name) as customer_name,
                 c.phone as customer_phone,
                 DATE(c.created_at) as customer_created_date,
                 o.order_id,
@@ -378,20 +652,19 @@ class MySQLETLPipeline:
             LEFT JOIN orders o ON c.customer_id = o.customer_id 
                 AND o.order_status NOT IN ('cancelled')
             WHERE c.created_at >= %s
+                AND c.email IS NOT NULL
             ORDER BY c.customer_id, o.created_at
             """
             
-            # Extract data from last 30 days
+            # Extract data from last 30 days, aggregating each chunk as it arrives
             cutoff_date = datetime.now() - timedelta(days=30)
-            df_raw = self.extract_data(extract_query, (cutoff_date,))
+            chunks = self.extract_data_chunked(extract_query, (cutoff_date,), prepared=True)
+            df_summary = self.transform_order_summary(chunks)
             
-            if df_raw.empty:
+            if df_summary.empty:
                 logger.warning("No data found for customer summary ETL")
                 return
             
-            # Transform data
-            df_summary = self.transform_order_summary(df_raw)
-            
             # Load to target table
             self.load_data(df_summary, 'customer_order_summary', 'upsert')
             
@@ -410,51 +683,85 @@ class MySQLETLPipeline:
         """
         if target_date is None:
             target_date = datetime.now().date() - timedelta(days=1)
-            
-        logger.info(f"Starting daily sales summary ETL for {target_date}")
+        elif isinstance(target_date, datetime):
+            target_date = target_date.date()
+        
+        self.run_daily_sales_summary_range_etl(target_date, target_date + timedelta(days=1))
+    
+    def run_daily_sales_summary_range_etl(self, start_date, end_date):
+        """
+        ETL pipeline for daily sales summaries over a range of days
+        
+        All days are aggregated by one query and loaded in one upsert.
+        
+        Args:
+            start_date: First date to process
+            end_date: Date to stop before (exclusive)
+        """
+        if self._source_is_target():
+            return self.run_daily_sales_summary_range_etl_sql(start_date, end_date)
+        
+        date_range = f"{start_date} to {end_date}"
+        logger.info(f"Starting daily sales summary ETL for {date_range}")
         
         try:
-            # Extract daily sales data
-            extract_query = """
-            SELECT 
-                DATE(o.created_at) as order_date,
-                COUNT(DISTINCT o.order_id) as total_orders,
-                SUM(o.total_amount) as total_order_value,
-                AVG(o.total_amount) as avg_order_value,
-                COUNT(DISTINCT o.customer_id) as total_customers,
-                COUNT(DISTINCT CASE 
-                    WHEN c.created_at >= DATE(o.created_at) - INTERVAL 1 DAY 
-                    THEN o.customer_id 
-                END) as new_customers,
-                DAYNAME(o.created_at) as day_of_week,
-                CASE WHEN DAYOFWEEK(o.created_at) IN (1, 7) THEN 1 ELSE 0 END as is_weekend
-            FROM orders o
-            JOIN customers c ON o.customer_id = c.customer_id
-            WHERE DATE(o.created_at) = %s
-                AND o.order_status NOT IN ('cancelled')
-            GROUP BY DATE(o.created_at)
-            """
-            
-            df_daily = self.extract_data(extract_query, (target_date,))
+            # Extract daily sales data, one row per day
+            df_daily = self.extract_data(DAILY_SALES_QUERY, (start_date, end_date), prepared=True)
             
             if df_daily.empty:
-                logger.warning(f"No sales data found for {target_date}")
+                logger.warning(f"No sales data found for {date_range}")
                 return
             
             # Add calculated fields
-            df_daily['summary_date'] = target_date
+            df_daily['summary_date'] = df_daily['order_date']
             df_daily['returning_customers'] = (
                 df_daily['total_customers'] - df_daily['new_customers']
             )
-            df_daily['last_calculated_at'] = datetime.now()
+            df_daily['last_calculated_at'] = pd.Timestamp.now()
             
             # Load to target table
             self.load_data(df_daily, 'daily_sales_summary', 'upsert')
             
-            logger.info(f"Daily sales summary ETL for {target_date} completed successfully")
+            logger.info(f"Daily sales summary ETL for {date_range} completed successfully")
+        
+        except Exception as e:
+            logger.error(f"Daily sales summary ETL failed for {date_range}: {e}")
+            raise
+    
+    def _source_is_target(self) -> bool:
+        """Whether source and target are the same database on the same server"""
+        source = self.config['source_database']
+        target = self.config['target_database']
+        return all(source[key] == target[key] for key in ('host', 'port', 'database'))
+    
+    def run_daily_sales_summary_range_etl_sql(self, start_date, end_date):
+        """
+        Daily sales summary ETL run entirely inside MySQL
+        
+        Used when the source tables are in the target database: one
+        INSERT ... SELECT aggregates and upserts the days, so no rows
+        cross the wire.
+        
+        Args:
+            start_date: First date to process
+            end_date: Date to stop before (exclusive)
+        """
+        date_range = f"{start_date} to {end_date}"
+        logger.info(f"Starting in-database daily sales summary ETL for {date_range}")
+        
+        try:
+            with self.get_connection('target') as connection:
+                cursor = connection.cursor()
+                cursor.execute(DAILY_SALES_UPSERT, (start_date, end_date))
+                affected_rows = cursor.rowcount
+                cursor.close()
+                connection.commit()
+            
+            logger.info(f"Daily sales summary ETL for {date_range} completed successfully "
+                        f"({affected_rows} rows affected)")
             
         except Exception as e:
-            logger.error(f"Daily sales summary ETL failed for {target_date}: {e}")
+            logger.error(f"Daily sales summary ETL failed for {date_range}: {e}")
             raise
     
     def run_full_pipeline(self):
@@ -467,13 +774,18 @@ class MySQLETLPipeline:
             self.initialize_connections()
             
             # Run individual ETL processes
-            self.run_customer_summary_etl()
-            self.run_daily_sales_summary_etl()
-            
-            # Run for last 7 days of daily summaries
-            for i in range(1, 8):
-                date = datetime.now().date() - timedelta(days=i)
-                self.run_daily_sales_summary_etl(date)
+            # The two ETLs share no state and each checks out its own pooled
+            # connections, so they run concurrently while waiting on MySQL.
+            # Daily summaries cover the last 7 days (yesterday included)
+            today = datetime.now().date()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(self.run_customer_summary_etl),
+                    executor.submit(self.run_daily_sales_summary_range_etl,
+                                    today - timedelta(days=7), today)
+                ]
+                for future in futures:
+                    future.result()
             
             logger.info("Full ETL pipeline completed successfully")
             
@@ -0,0 +1,54 @@
+"""
+Tests for the customer order summary transform in scripts/etl
+"""
+
+import os
+import sys
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('mysql.connector')
+pytest.importorskip('yaml')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'scripts', 'etl'))
+from mysql_etl_pipeline import MySQLETLPipeline  # noqa: E402
+
+
+def order_rows():
+    """Extract rows as the LEFT JOIN returns them: customer 3 has no orders"""
+    return pd.DataFrame({
+        'customer_id': [1, 1, 2, 3],
+        'customer_email': ['a@example.com', 'a@example.com', 'b@example.com', 'c@example.com'],
+        'customer_name': ['Ann A', 'Ann A', 'Bob B', 'Cy C'],
+        'order_id': [10, 11, 12, None],
+        'total_amount': [Decimal('100.00'), Decimal('50.50'), Decimal('20.00'), None],
+        'created_at': [datetime(2026, 1, 1), datetime(2026, 2, 1), datetime(2026, 3, 1), None],
+    })
+
+
+def chunks(size):
+    frame = order_rows()
+    return (frame.iloc[start:start + size] for start in range(0, len(frame), size))
+
+
+@pytest.fixture
+def pipeline():
+    return MySQLETLPipeline(config_file='does-not-exist.yaml')
+
+
+@pytest.mark.parametrize('source', [order_rows, lambda: chunks(1)], ids=['frame', 'chunks'])
+def test_order_summary_handles_decimal_amounts_and_orderless_customers(pipeline, source):
+    summary = pipeline.transform_order_summary(source()).set_index('customer_id')
+
+    assert summary.loc[1, 'total_orders'] == 2
+    assert summary.loc[1, 'total_spent'] == pytest.approx(150.5)
+    assert summary.loc[1, 'avg_order_value'] == pytest.approx(75.25)
+    assert summary.loc[2, 'avg_order_value'] == pytest.approx(20.0)
+
+    assert summary.loc[3, 'total_orders'] == 0
+    assert pd.isna(summary.loc[3, 'avg_order_value'])
+    assert pd.isna(summary.loc[3, 'days_since_last_order'])
+    assert summary.loc[3, 'customer_segment'] == 'new'